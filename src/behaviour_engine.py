@@ -13,7 +13,7 @@ import json
 import logging
 from typing import Any
 
-from .llm_client import analyse_behaviour_with_llm
+from .llm_client import analyse_behaviour_batch_with_llm, analyse_behaviour_with_llm
 from .memory import UserMemory
 from .memory_service import MemoryService
 
@@ -158,6 +158,82 @@ def analyse_behaviour(
     return _apply_adaptive_weighting(keyword_result, user_memory)
 
 
+def analyse_behaviour_batch(
+    user_inputs: list[str],
+    user_memories: list[UserMemory],
+    behaviour_db: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """
+    Analyze several user inputs, using one LLM request for the whole batch.
+
+    If the batched request fails, each input goes through analyse_behaviour
+    individually. Inputs for which the batch named an unknown principle fall
+    back to keyword-based analysis.
+
+    Args:
+        user_inputs: The users' messages, in order.
+        user_memories: UserMemory instances matching user_inputs by position.
+        behaviour_db: Dictionary containing behavioural principles (from behaviour_principles.json).
+
+    Returns:
+        list[dict]: One analysis result per input, each with the same
+            structure as analyse_behaviour.
+
+    Raises:
+        ValueError: If user_inputs and user_memories differ in length.
+    """
+    if len(user_inputs) != len(user_memories):
+        raise ValueError("user_inputs and user_memories must have the same length")
+
+    llm_results = analyse_behaviour_batch_with_llm(
+        user_inputs, user_memories, behaviour_db
+    )
+
+    if llm_results is None:
+        logger.info("Batched LLM analysis unavailable, analysing inputs one by one")
+        return [
+            analyse_behaviour(user_input, user_memory, behaviour_db)
+            for user_input, user_memory in zip(user_inputs, user_memories, strict=True)
+        ]
+
+    results = []
+    for user_input, user_memory, llm_result in zip(
+        user_inputs, user_memories, llm_results, strict=True
+    ):
+        result = llm_result or _analyse_behaviour_keyword(
+            user_input, user_memory, behaviour_db
+        )
+        results.append(_apply_adaptive_weighting(result, user_memory))
+    return results
+
+
+# Every (keyword, principle_id) pair from KEYWORD_MAPPINGS, flattened once so
+# that matching is a single pass over all triggers
+_KEYWORD_INDEX: tuple[tuple[str, str], ...] = tuple(
+    (keyword, principle_id)
+    for principle_id, keywords in KEYWORD_MAPPINGS.items()
+    for keyword in keywords
+)
+
+
+def _match_keywords(text_lower: str) -> dict[str, list[str]]:
+    """
+    Find the KEYWORD_MAPPINGS keywords contained in already-lowercased text.
+
+    Args:
+        text_lower: The user's message, lowercased.
+
+    Returns:
+        dict: Maps each principle with at least one match to its matched
+            keywords, in KEYWORD_MAPPINGS order.
+    """
+    matched: dict[str, list[str]] = {}
+    for keyword, principle_id in _KEYWORD_INDEX:
+        if keyword in text_lower:
+            matched.setdefault(principle_id, []).append(keyword)
+    return matched
+
+
 def _analyse_behaviour_keyword(
     user_input: str,
     user_memory: UserMemory,
@@ -177,24 +253,13 @@ def _analyse_behaviour_keyword(
     Returns:
         dict: Analysis result with the same structure as analyse_behaviour.
     """
-    user_input_lower = user_input.lower()
     principles = behaviour_db.get("principles", [])
 
     # Score each principle based on keyword matches
-    principle_scores: dict[str, int] = {}
-    matched_keywords: dict[str, list[str]] = {}
-
-    for principle_id, keywords in KEYWORD_MAPPINGS.items():
-        score = 0
-        matches = []
-        for keyword in keywords:
-            if keyword in user_input_lower:
-                score += 1
-                matches.append(keyword)
-
-        if score > 0:
-            principle_scores[principle_id] = score
-            matched_keywords[principle_id] = matches
+    matched_keywords = _match_keywords(user_input.lower())
+    principle_scores = {
+        principle_id: len(matches) for principle_id, matches in matched_keywords.items()
+    }
 
     # Also check user memory for additional context
     # If user has streaks, loss_aversion might be relevant
@@ -237,10 +302,8 @@ def _analyse_behaviour_keyword(
     total_keywords_for_principle = len(KEYWORD_MAPPINGS.get(best_principle_id, []))
     matched_count = len(matched_triggers)
     memory_bonus = 0
-    active_streaks = MemoryService.get_active_streaks(user_memory)
     if best_principle_id == "loss_aversion" and active_streaks:
         memory_bonus += 1
-    recent_struggles = MemoryService.get_recent_struggles(user_memory)
     if best_principle_id == "commitment_devices" and len(recent_struggles) >= 2:
         memory_bonus += 1
 
@@ -24,7 +24,7 @@ from src.memory import MAX_CONVERSATION_CONTEXT_LENGTH, UserMemory
 from src.memory_service import MemoryService
 from src.models import AnalysisResult, BehaviourDatabase
 
-from .config import get_adk_model_name, get_api_key, load_env
+from .config import get_adk_model_name, get_api_key, is_llm_disabled, load_env
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +80,7 @@ def _analyze_user_behavior(
     user_input: str,
     memory: UserMemory,
     behaviour_db: dict[str, Any],
+    precomputed: Optional[dict[str, Any]] = None,
 ) -> AnalysisResult:
     """
     Analyze user behavior and return structured result.
@@ -91,6 +92,8 @@ def _analyze_user_behavior(
         user_input: The user's message describing their situation.
         memory: UserMemory instance for context.
         behaviour_db: Behaviour principles database.
+        precomputed: Result of an earlier analyse_behaviour call for this
+            input. When given, the analysis engine is not called again.
 
     Returns:
         AnalysisResult: Structured analysis with principle, confidence, etc.
@@ -102,7 +105,11 @@ def _analyze_user_behavior(
         >>> print(result.detected_principle_id)
         'friction_increase'
     """
-    analysis_dict = analyse_behaviour(user_input, memory, behaviour_db)
+    analysis_dict = (
+        precomputed
+        if precomputed is not None
+        else analyse_behaviour(user_input, memory, behaviour_db)
+    )
     analysis = AnalysisResult.from_dict(analysis_dict)
 
     logger.info(
@@ -166,11 +173,12 @@ def _build_template_response(
     reason = analysis.reason
     interventions = analysis.intervention_suggestions
     confidence = analysis.confidence
-    behaviour_db_obj = BehaviourDatabase.from_dict(behaviour_db)
 
     response_parts = []
 
     if detected_principle_id:
+        # Only build the typed database when there is a principle to look up
+        behaviour_db_obj = BehaviourDatabase.from_dict(behaviour_db)
         principle = behaviour_db_obj.get_principle_by_id(detected_principle_id)
         principle_name = principle.name if principle else detected_principle_id
 
@@ -517,7 +525,8 @@ def call_adk_agent(prompt_context: dict[str, Any]) -> Optional[str]:
             - "memory_summary" (str): Brief summary of user's memory/context
 
     Returns:
-        str or None: The ADK agent's response text, or None if the call fails.
+        str or None: The ADK agent's response text, or None if the call fails
+            or HABIT_DISABLE_LLM=1.
 
     Example:
         >>> context = {"user_input": "I keep ordering food", "analysis_result": {...}}
@@ -525,6 +534,10 @@ def call_adk_agent(prompt_context: dict[str, Any]) -> Optional[str]:
         >>> if response:
         ...     print(response)
     """
+    if is_llm_disabled():
+        logger.debug("ADK agent call skipped: HABIT_DISABLE_LLM is set")
+        return None
+
     start_time = time.time()
 
     try:
@@ -594,6 +607,8 @@ def run_once(
     user_input: str,
     memory: UserMemory,
     behaviour_db: dict[str, Any],
+    *,
+    analysis: Optional[dict[str, Any]] = None,
 ) -> str:
     """
     Process a single user interaction and generate a coaching response.
@@ -610,6 +625,9 @@ def run_once(
         user_input: The user's message or description of their situation.
         memory: UserMemory instance to track user state across interactions.
         behaviour_db: Dictionary containing behavioural principles.
+        analysis: Result of an earlier analyse_behaviour call for the same
+            input and memory. When given, step 2 reuses it instead of
+            analysing the input again.
 
     Returns:
         str: A coaching response (ADK-generated or template-based) with principle
@@ -631,22 +649,24 @@ def run_once(
     # Record user input in conversation history
     memory.add_conversation_turn("user", user_input)
 
-    # Step 1: Analyze user behaviour
-    analysis = _analyze_user_behavior(user_input, memory, behaviour_db)
-    analysis_dict = analysis.to_dict()
+    # Step 1: Analyze user behaviour (or reuse the caller's analysis)
+    result = _analyze_user_behavior(
+        user_input, memory, behaviour_db, precomputed=analysis
+    )
+    analysis_dict = result.to_dict()
 
     # Step 2: Check confidence and handle low-confidence detections
-    if analysis.confidence < CONFIDENCE_THRESHOLD and analysis.detected_principle_id:
+    if result.confidence < CONFIDENCE_THRESHOLD and result.detected_principle_id:
         response = _handle_low_confidence_case(
-            analysis.detected_principle_id,
+            result.detected_principle_id,
             user_input,
-            analysis.confidence,
+            result.confidence,
             behaviour_db,
         )
         memory.add_conversation_turn(
             "assistant",
             response,
-            {"confidence": analysis.confidence, "clarification": True},
+            {"confidence": result.confidence, "clarification": True},
         )
         return response
 
@@ -670,11 +690,11 @@ def run_once(
             extra={
                 "event": "response_generation",
                 "source": "adk",
-                "principle_id": analysis.detected_principle_id,
-                "confidence": analysis.confidence,
+                "principle_id": result.detected_principle_id,
+                "confidence": result.confidence,
             },
         )
-        return _finalize_response(adk_response, analysis, memory, "adk")
+        return _finalize_response(adk_response, result, memory, "adk")
 
     # Step 5: Fallback to template-based response
     logger.info(
@@ -682,13 +702,13 @@ def run_once(
         extra={
             "event": "response_generation",
             "source": "template",
-            "principle_id": analysis.detected_principle_id,
-            "confidence": analysis.confidence,
+            "principle_id": result.detected_principle_id,
+            "confidence": result.confidence,
         },
     )
 
-    template_response = _build_template_response(analysis, behaviour_db)
-    return _finalize_response(template_response, analysis, memory, "template")
+    template_response = _build_template_response(result, behaviour_db)
+    return _finalize_response(template_response, result, memory, "template")
 
 
 def generate_session_summary(memory: UserMemory) -> str:
@@ -189,6 +189,20 @@ def get_api_key() -> str:
     return api_key
 
 
+def is_llm_disabled() -> bool:
+    """
+    Check whether LLM calls are switched off for this process.
+
+    Setting HABIT_DISABLE_LLM=1 makes behaviour analysis skip the LLM and use
+    keyword matching only, with no network access. The test suite sets it by
+    default so that runs are fast and deterministic.
+
+    Returns:
+        bool: True if HABIT_DISABLE_LLM is set to "1", False otherwise.
+    """
+    return os.getenv("HABIT_DISABLE_LLM", "0") == "1"
+
+
 def get_adk_model_name() -> str:
     """
     Get the model name to be used by the ADK HabitLedger agent.
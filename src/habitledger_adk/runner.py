@@ -8,8 +8,10 @@ Uses Google ADK's native InMemorySessionService for session management.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Any, Optional
 
 from google.adk.sessions import Session
 from google.genai import Client
@@ -26,7 +28,7 @@ from src.behaviour_engine import load_behaviour_db
 from src.config import get_adk_model_name, get_api_key, load_env, setup_logging
 from src.memory import UserMemory
 from src.models import Goal
-from src.session_db import create_session_service
+from src.session_db import get_session_service
 
 from .agent import habitledger_coach_tool
 
@@ -131,14 +133,22 @@ def create_habitledger_tool() -> Tool:
     return Tool(function_declarations=[function_declaration])
 
 
+@functools.lru_cache(maxsize=1)
+def _get_behaviour_db() -> dict[str, Any]:
+    """Load the bundled behaviour database once and share it between runners."""
+    db_path = Path(__file__).parent.parent.parent / "data" / "behaviour_principles.json"
+    return load_behaviour_db(str(db_path))
+
+
 async def create_runner(
     user_id: str = "demo_user",
 ):
     """
     Create an ADK runner with async session management.
 
-    This function initializes a Google GenAI client and creates an
-    InMemorySessionService for session state management with async operations.
+    This function initializes a Google GenAI client and uses the shared
+    InMemorySessionService for session state management with async operations,
+    so calls for the same user return the session created earlier.
 
     Args:
         user_id: User identifier for the session (default: "demo_user").
@@ -157,18 +167,15 @@ async def create_runner(
     api_key = get_api_key()
     client = Client(api_key=api_key)
 
-    # Load behaviour database
-    from pathlib import Path
-
-    db_path = Path(__file__).parent.parent.parent / "data" / "behaviour_principles.json"
-    behaviour_db = load_behaviour_db(str(db_path))
+    # Load behaviour database (parsed once per process)
+    behaviour_db = _get_behaviour_db()
 
     # Check if session already exists for this user
     session_id = f"session_{user_id}"
     app_name = "habitledger"
 
-    # Create session service using ADK's InMemorySessionService
-    session_service = create_session_service()
+    # Reuse the process-wide session service so existing sessions are found
+    session_service = get_session_service()
 
     try:
         session = await session_service.get_session(
@@ -186,20 +193,22 @@ async def create_runner(
 
     except Exception:
         logger.info("Session not found, creating new one")
-        # Session doesn't exist, create new one
-        session = await session_service.create_session(
-            session_id=session_id,
-            app_name=app_name,
-            user_id=user_id,
-        )
-
-        # Initialize user memory and save to session
+        # Session doesn't exist, initialize user memory and create new one
         user_memory = UserMemory(user_id=user_id)
         user_memory.goals = [
             Goal(description="Build better financial habits"),
             Goal(description="Control impulse spending"),
         ]
-        save_memory_to_session(session, user_memory)
+
+        # Pass memory as initial state so the service's stored copy holds it
+        initial_state: dict[str, Any] = {}
+        user_memory.save_to_session_state(initial_state, scope="user:")
+        session = await session_service.create_session(
+            session_id=session_id,
+            app_name=app_name,
+            user_id=user_id,
+            state=initial_state,
+        )
 
         logger.info(
             "New session created",
@@ -209,6 +218,48 @@ async def create_runner(
     return client, session_service, session, behaviour_db
 
 
+async def create_runners_bulk(
+    user_ids: list[str],
+    limit: int = 8,
+) -> list[tuple]:
+    """
+    Create runners for several users concurrently, at most limit at a time.
+
+    Each user's runner is created by create_runner inside an asyncio.TaskGroup,
+    with a semaphore bounding how many run their setup at once so large
+    fan-outs do not all hit the shared session service together.
+
+    Args:
+        user_ids: User identifiers to create runners for.
+        limit: Maximum number of runners being created at once (default: 8).
+
+    Returns:
+        list[tuple]: One (client, session_service, session, behaviour_db) tuple
+            per user, in the same order as user_ids.
+
+    Raises:
+        ValueError: If limit is less than 1.
+
+    Example:
+        >>> runners = await create_runners_bulk(["user1", "user2"], limit=2)
+        >>> [session.user_id for _, _, session, _ in runners]
+        ['user1', 'user2']
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _create(user_id: str) -> tuple:
+        async with semaphore:
+            return await create_runner(user_id=user_id)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_create(user_id)) for user_id in user_ids]
+
+    return [task.result() for task in tasks]
+
+
 async def run_cli() -> None:
     """
     Run the HabitLedger ADK agent in a simple async CLI loop with session persistence.
@@ -0,0 +1,135 @@
+"""
+On-disk cache for LLM behaviour analysis results.
+
+This module stores validated LLM analysis results in a single SQLite file so
+that repeated runs with identical prompts (local iteration, CI re-runs) skip
+the network round-trip. Entries are keyed by a SHA-256 hash of the prompt,
+the model name and the set of available principles.
+
+The cache is enabled by default and can be disabled by setting the
+HABIT_LLM_CACHE environment variable to "0". Cache failures are logged and
+treated as misses; they never interrupt analysis. Delete the cache file after
+a prompt or model change: response parsing code and model updates behind an
+unchanged model name are not part of the key.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import get_working_directory
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached result format or the request shape changes
+SCHEMA_VERSION = 2
+
+_CACHE_FILENAME = ".llm_cache.sqlite"
+
+
+def is_enabled() -> bool:
+    """
+    Check whether the LLM cache is enabled.
+
+    Returns:
+        bool: False if HABIT_LLM_CACHE is set to "0", True otherwise.
+    """
+    return os.getenv("HABIT_LLM_CACHE", "1") != "0"
+
+
+def get_cache_path() -> Path:
+    """
+    Get the path of the SQLite cache file.
+
+    Returns:
+        Path: Cache file inside the environment's working directory.
+    """
+    return get_working_directory() / _CACHE_FILENAME
+
+
+def make_key(
+    prompt: str,
+    model_name: str,
+    behaviour_db: dict[str, Any],
+    generation_config: Optional[dict[str, Any]] = None,
+) -> str:
+    """
+    Build the cache key for an LLM request.
+
+    Args:
+        prompt: The full prompt sent to the LLM, including memory context.
+        model_name: Name of the model the request is sent to.
+        behaviour_db: Dictionary containing behavioural principles.
+        generation_config: JSON-serializable generation settings (temperature,
+            response schema, ...) that affect the reply.
+
+    Returns:
+        str: Hex-encoded SHA-256 digest identifying the request.
+    """
+    payload = {
+        "prompt": prompt,
+        "model": model_name,
+        "config": generation_config or {},
+        "principles": sorted(
+            p.get("id", "") for p in behaviour_db.get("principles", [])
+        ),
+        "schema_ver": SCHEMA_VERSION,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the table if needed."""
+    conn = sqlite3.connect(get_cache_path())
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache "
+        "(hash TEXT PRIMARY KEY, response_json TEXT NOT NULL)"
+    )
+    return conn
+
+
+def get(key: str) -> Optional[dict[str, Any]]:
+    """
+    Look up a cached analysis result.
+
+    Args:
+        key: Cache key from make_key.
+
+    Returns:
+        dict or None: The cached result, or None on a miss or cache error.
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT response_json FROM llm_cache WHERE hash = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("LLM cache read failed: %s", e)
+        return None
+
+    return json.loads(row[0]) if row else None
+
+
+def put(key: str, value: dict[str, Any]) -> None:
+    """
+    Store an analysis result in the cache.
+
+    Args:
+        key: Cache key from make_key.
+        value: JSON-serializable analysis result.
+    """
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (hash, response_json) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+    except sqlite3.Error as e:
+        logger.warning("LLM cache write failed: %s", e)
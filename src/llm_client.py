@@ -6,36 +6,102 @@ It uses the Google GenAI API to analyze user input and recommend appropriate
 behavioural principles and interventions.
 """
 
+import functools
 import logging
 import os
+import threading
 import time
 from typing import Any, Optional
 
 from google.genai import Client
-from google.genai.types import (
-    FunctionDeclaration,
-    GenerateContentConfig,
-    Schema,
-    Tool,
-    Type,
-)
+from google.genai.types import GenerateContentConfig
+from pydantic import BaseModel, Field, ValidationError
 
-from .config import get_adk_model_name, get_api_key
-from .memory import UserMemory
+from . import llm_cache
+from .config import get_adk_model_name, get_api_key, is_llm_disabled
+from .memory import MemoryFingerprint, UserMemory
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Rate limiting configuration
 _last_llm_call_time = 0.0
+_rate_limit_lock = threading.Lock()
 _MIN_CALL_INTERVAL = float(
     os.getenv("LLM_MIN_CALL_INTERVAL", "1.0")
 )  # seconds between calls
 
+# LLM-based detection has higher base confidence than keyword matching
+_LLM_CONFIDENCE = 0.85
+
+
+class LLMAnalysisOutput(BaseModel):
+    """Structured output schema for a single LLM behaviour analysis."""
+
+    principle_id: str = Field(
+        description="ID of the most relevant behavioural principle from the list"
+    )
+    reason: str = Field(
+        description="Why this principle was selected based on the user's input"
+    )
+    intervention_suggestions: list[str] = Field(
+        description="1-3 specific, actionable intervention suggestions"
+    )
+    triggers_matched: list[str] = Field(
+        description="Words or phrases from the input that indicated this principle"
+    )
+
+
+class LLMBatchAnalysisOutput(BaseModel):
+    """Structured output schema for a batched LLM behaviour analysis."""
+
+    results: list[LLMAnalysisOutput] = Field(
+        description="One analysis per numbered situation, in order"
+    )
+
+
+def _wait_for_rate_limit() -> float:
+    """
+    Sleep until the minimum interval since the previous LLM call has passed.
+
+    The lock spaces out call start times when analyses run on several
+    threads; the requests themselves still overlap once started.
+
+    Returns:
+        float: Timestamp recorded as the start of the new call.
+    """
+    global _last_llm_call_time
+    with _rate_limit_lock:
+        elapsed = time.time() - _last_llm_call_time
+        if elapsed < _MIN_CALL_INTERVAL:
+            sleep_time = _MIN_CALL_INTERVAL - elapsed
+            logger.debug("Rate limiting: sleeping %.2fs", sleep_time)
+            time.sleep(sleep_time)
+
+        _last_llm_call_time = time.time()
+        return _last_llm_call_time
+
+
+def _build_principles_list(behaviour_db: dict[str, Any]) -> str:
+    """
+    Format the available principles as one "- id: name - description" line each.
+
+    Args:
+        behaviour_db: Dictionary containing behavioural principles.
+
+    Returns:
+        str: Newline-separated principle list for the prompt.
+    """
+    return "\n".join(
+        f"- {p.get('id', '')}: {p.get('name', '')} - {p.get('description', '')}"
+        for p in behaviour_db.get("principles", [])
+    )
+
 
 def _build_llm_prompt(
     user_input: str,
     user_memory: Any,
+    behaviour_db: dict[str, Any],
 ) -> str:
     """
     Build the prompt for LLM behaviour analysis.
@@ -43,6 +109,7 @@ def _build_llm_prompt(
     Args:
         user_input: The user's message.
         user_memory: UserMemory instance.
+        behaviour_db: Dictionary containing behavioural principles.
 
     Returns:
         str: Formatted prompt for the LLM.
@@ -75,19 +142,76 @@ User Context:
 
 {profile_context}
 
-Please analyze this situation and use the analyse_behaviour tool to provide:
-1. The most relevant behavioural principle ID
+Available principles:
+{_build_principles_list(behaviour_db)}
+
+Please analyze this situation and respond with a JSON object providing:
+1. The most relevant behavioural principle ID from the list above
 2. Clear reasoning for your selection
 3. 1-3 specific, actionable intervention suggestions
 4. The key triggers or phrases that led to your selection"""
 
 
+def _build_batch_llm_prompt(
+    user_inputs: list[str],
+    user_memories: list[Any],
+    behaviour_db: dict[str, Any],
+) -> str:
+    """
+    Build a single prompt that asks the LLM to analyse several situations.
+
+    The task description is emitted once and the situations follow as a
+    numbered list, so the shared instructions are not repeated per item.
+
+    Args:
+        user_inputs: The users' messages, in order.
+        user_memories: UserMemory instances matching user_inputs by position.
+        behaviour_db: Dictionary containing behavioural principles.
+
+    Returns:
+        str: Formatted batch prompt for the LLM.
+    """
+    situations = []
+    for i, (user_input, user_memory) in enumerate(
+        zip(user_inputs, user_memories, strict=True), start=1
+    ):
+        memory_context = _build_memory_context(user_memory).replace("\n", "; ")
+        situations.append(f"{i}. {user_input}\n   Context: {memory_context}")
+
+    situations_text = "\n".join(situations)
+
+    return f"""Analyze each of the following numbered user situations and identify the most relevant behavioural science principle for each one.
+
+{situations_text}
+
+Available principles:
+{_build_principles_list(behaviour_db)}
+
+Please respond with a JSON object whose "results" array holds exactly {len(user_inputs)} entries, in the same order as the numbered situations. For each situation provide:
+1. The most relevant behavioural principle ID from the list above
+2. Clear reasoning for your selection
+3. 1-3 specific, actionable intervention suggestions
+4. The key triggers or phrases that led to your selection"""
+
+
+def _output_to_result(output: LLMAnalysisOutput) -> dict[str, Any]:
+    """Convert a validated LLM output into the analysis result dictionary."""
+    return {
+        "detected_principle_id": output.principle_id,
+        "reason": output.reason,
+        "intervention_suggestions": list(output.intervention_suggestions),
+        "triggers_matched": list(output.triggers_matched),
+        "source": "adk",
+        "confidence": _LLM_CONFIDENCE,
+    }
+
+
 def _parse_llm_response(
     response: Any,
     behaviour_db: dict[str, Any],
 ) -> Optional[dict[str, Any]]:
     """
-    Parse the LLM response and extract analysis results.
+    Parse the LLM's JSON response and extract analysis results.
 
     Args:
         response: The LLM response object.
@@ -96,31 +220,57 @@ def _parse_llm_response(
     Returns:
         dict or None: Analysis result if successful, None otherwise.
     """
-    if (
-        response.candidates
-        and response.candidates[0].content
-        and response.candidates[0].content.parts
-    ):
-        for part in response.candidates[0].content.parts:
-            if hasattr(part, "function_call") and part.function_call:
-                # Extract the function call arguments
-                args = part.function_call.args
-
-                # Convert to our expected format
-                result = {
-                    "detected_principle_id": args.get("principle_id"),
-                    "reason": args.get("reason", ""),
-                    "intervention_suggestions": list(
-                        args.get("intervention_suggestions", [])
-                    ),
-                    "triggers_matched": list(args.get("triggers_matched", [])),
-                    "source": "adk",
-                    "confidence": 0.85,  # LLM-based detection has higher base confidence
-                }
+    if not response.text:
+        return None
 
-                return _validate_principle(result, behaviour_db)
+    try:
+        output = LLMAnalysisOutput.model_validate_json(response.text)
+    except ValidationError as e:
+        logger.warning("LLM returned invalid structured output: %s", e)
+        return None
 
-    return None
+    return _validate_principle(_output_to_result(output), behaviour_db)
+
+
+def _parse_batch_llm_response(
+    response: Any,
+    behaviour_db: dict[str, Any],
+    expected_count: int,
+) -> Optional[list[Optional[dict[str, Any]]]]:
+    """
+    Parse a batched JSON response into one analysis result per situation.
+
+    Args:
+        response: The LLM response object.
+        behaviour_db: Dictionary containing behavioural principles.
+        expected_count: Number of situations that were sent.
+
+    Returns:
+        list or None: One entry per situation, in order. Entries naming an
+            unknown principle are None. Returns None when the response is not
+            valid structured output or the result count does not match.
+    """
+    if not response.text:
+        return None
+
+    try:
+        output = LLMBatchAnalysisOutput.model_validate_json(response.text)
+    except ValidationError as e:
+        logger.warning("LLM returned invalid batch structured output: %s", e)
+        return None
+
+    if len(output.results) != expected_count:
+        logger.warning(
+            "LLM batch returned %d results for %d situations",
+            len(output.results),
+            expected_count,
+        )
+        return None
+
+    return [
+        _validate_principle(_output_to_result(item), behaviour_db)
+        for item in output.results
+    ]
 
 
 def _validate_principle(
@@ -161,78 +311,22 @@ def _validate_principle(
     return result
 
 
-def _create_behaviour_analysis_tool(behaviour_db: dict[str, Any]) -> Tool:
+def _structured_output_config(schema: type[BaseModel]) -> GenerateContentConfig:
     """
-    Create a tool definition for the LLM to use for behaviour analysis.
-
-    This tool provides the LLM with information about available behavioural
-    principles and asks it to recommend which principle(s) match the user's
-    situation.
+    Build a generation config that constrains the reply to a JSON schema.
 
     Args:
-        behaviour_db: Dictionary containing behavioural principles from behaviour_principles.json.
+        schema: Pydantic model describing the expected JSON object.
 
     Returns:
-        Tool: Configured tool with behaviour analysis function declaration.
+        GenerateContentConfig: Config requesting application/json output.
     """
-    # Extract principle information for the tool description
-    principles = behaviour_db.get("principles", [])
-    principle_descriptions = []
-
-    for principle in principles:
-        principle_id = principle.get("id", "")
-        name = principle.get("name", "")
-        description = principle.get("description", "")
-        principle_descriptions.append(f"- {principle_id}: {name} - {description}")
-
-    principles_list = "\n".join(principle_descriptions)
-
-    # Create schema for parameters
-    parameters_schema = Schema(
-        type=Type.OBJECT,
-        properties={
-            "principle_id": Schema(
-                type=Type.STRING,
-                description=(
-                    f"The ID of the most relevant behavioural principle. "
-                    f"Available principles:\n{principles_list}"
-                ),
-            ),
-            "reason": Schema(
-                type=Type.STRING,
-                description="Clear explanation of why this principle was selected based on the user's input",
-            ),
-            "intervention_suggestions": Schema(
-                type=Type.ARRAY,
-                items=Schema(type=Type.STRING),
-                description="List of 1-3 specific, actionable intervention suggestions for the user",
-            ),
-            "triggers_matched": Schema(
-                type=Type.ARRAY,
-                items=Schema(type=Type.STRING),
-                description="List of specific words or phrases from user input that indicated this principle",
-            ),
-        },
-        required=[
-            "principle_id",
-            "reason",
-            "intervention_suggestions",
-            "triggers_matched",
-        ],
+    return GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=schema,
+        temperature=0.3,  # Lower temperature for more consistent analysis
     )
 
-    function_declaration = FunctionDeclaration(
-        name="analyse_behaviour",
-        description=(
-            "Analyzes user's financial habit situation and identifies the most relevant "
-            "behavioural science principle. Returns the principle ID, reasoning, "
-            "intervention suggestions, and matched triggers."
-        ),
-        parameters=parameters_schema,
-    )
-
-    return Tool(function_declarations=[function_declaration])
-
 
 def analyse_behaviour_with_llm(
     user_input: str,
@@ -247,7 +341,9 @@ def analyse_behaviour_with_llm(
     understanding of context and nuance to make better recommendations than
     keyword-based matching alone.
 
-    Implements rate limiting to prevent API quota exhaustion.
+    Implements rate limiting to prevent API quota exhaustion. Successful
+    results are cached on disk (see llm_cache) unless HABIT_LLM_CACHE=0.
+    Returns None without calling the API when HABIT_DISABLE_LLM=1.
 
     Args:
         user_input: The user's message or description of their behaviour/struggle.
@@ -272,16 +368,40 @@ def analyse_behaviour_with_llm(
         >>> print(result["detected_principle_id"]) if result else print("Failed")
         friction_increase
     """
-    # Rate limiting to prevent quota exhaustion
-    global _last_llm_call_time
-    elapsed = time.time() - _last_llm_call_time
-    if elapsed < _MIN_CALL_INTERVAL:
-        sleep_time = _MIN_CALL_INTERVAL - elapsed
-        logger.debug("Rate limiting: sleeping %.2fs", sleep_time)
-        time.sleep(sleep_time)
-
-    start_time = time.time()
-    _last_llm_call_time = start_time
+    if is_llm_disabled():
+        logger.debug("LLM analysis skipped: HABIT_DISABLE_LLM is set")
+        return None
+
+    model_name = get_adk_model_name()
+    prompt = _build_llm_prompt(user_input, user_memory, behaviour_db)
+
+    # Constrain the reply to the analysis JSON schema
+    config = _structured_output_config(LLMAnalysisOutput)
+
+    cache_key = None
+    if llm_cache.is_enabled():
+        cache_key = llm_cache.make_key(
+            prompt,
+            model_name,
+            behaviour_db,
+            generation_config={
+                "response_mime_type": config.response_mime_type,
+                "response_schema": LLMAnalysisOutput.model_json_schema(),
+                "temperature": config.temperature,
+            },
+        )
+        cached_result = llm_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(
+                "LLM analysis served from cache",
+                extra={
+                    "event": "llm_cache_hit",
+                    "principle_id": cached_result.get("detected_principle_id"),
+                },
+            )
+            return cached_result
+
+    start_time = _wait_for_rate_limit()
     user_input_truncated = user_input[:100] if len(user_input) > 100 else user_input
 
     logger.info(
@@ -302,25 +422,12 @@ def analyse_behaviour_with_llm(
         # Initialize client
         api_key = get_api_key()
         client = Client(api_key=api_key)
-        model_name = get_adk_model_name()
 
         logger.debug(
             "LLM client initialized",
             extra={"model": model_name},
         )
 
-        # Create the behaviour analysis tool
-        analysis_tool = _create_behaviour_analysis_tool(behaviour_db)
-
-        # Build prompt
-        prompt = _build_llm_prompt(user_input, user_memory)
-
-        # Configure the generation
-        config = GenerateContentConfig(
-            tools=[analysis_tool],
-            temperature=0.3,  # Lower temperature for more consistent analysis
-        )
-
         # Generate response
         logger.info(
             "Sending request to LLM for behaviour analysis",
@@ -340,7 +447,7 @@ def analyse_behaviour_with_llm(
             extra={
                 "event": "llm_response",
                 "duration_ms": llm_duration_ms,
-                "has_candidates": bool(response.candidates),
+                "has_text": bool(response.text),
             },
         )
 
@@ -370,14 +477,16 @@ def analyse_behaviour_with_llm(
                     "triggers": result.get("triggers_matched", []),
                 },
             )
+            if cache_key is not None:
+                llm_cache.put(cache_key, result)
             return result
 
         total_duration_ms = int((time.time() - start_time) * 1000)
         logger.warning(
-            "LLM did not return a function call",
+            "LLM did not return a valid analysis",
             extra={
                 "event": "llm_analysis_failed",
-                "reason": "no_function_call",
+                "reason": "invalid_structured_output",
                 "duration_ms": total_duration_ms,
             },
         )
@@ -412,32 +521,142 @@ def analyse_behaviour_with_llm(
         return None
 
 
+def analyse_behaviour_batch_with_llm(
+    user_inputs: list[str],
+    user_memories: list[UserMemory],
+    behaviour_db: dict[str, Any],
+) -> Optional[list[Optional[dict[str, Any]]]]:
+    """
+    Analyze several user inputs with a single LLM request.
+
+    The shared instructions and principle list are sent once, followed by
+    the numbered situations, which saves a round-trip and the repeated
+    prompt tokens per additional input.
+
+    Args:
+        user_inputs: The users' messages, in order.
+        user_memories: UserMemory instances matching user_inputs by position.
+        behaviour_db: Dictionary containing behavioural principles (from behaviour_principles.json).
+
+    Returns:
+        list or None: One result per input with the same structure as
+            analyse_behaviour_with_llm, or None for an input whose suggested
+            principle is unknown. Returns None if the whole request fails or
+            HABIT_DISABLE_LLM=1.
+
+    Example:
+        >>> results = analyse_behaviour_batch_with_llm(
+        ...     ["I keep ordering food delivery", "I forget to save"],
+        ...     [memory, memory],
+        ...     behaviour_db,
+        ... )
+        >>> [r["detected_principle_id"] for r in results] if results else None
+        ['friction_increase', 'default_effect']
+    """
+    if not user_inputs:
+        return []
+
+    if is_llm_disabled():
+        logger.debug("LLM batch analysis skipped: HABIT_DISABLE_LLM is set")
+        return None
+
+    start_time = _wait_for_rate_limit()
+
+    logger.info(
+        "Starting batched LLM behaviour analysis",
+        extra={"event": "llm_batch_analysis_start", "batch_size": len(user_inputs)},
+    )
+
+    try:
+        client = Client(api_key=get_api_key())
+        model_name = get_adk_model_name()
+
+        response = client.models.generate_content(
+            model=model_name,
+            contents=_build_batch_llm_prompt(user_inputs, user_memories, behaviour_db),
+            config=_structured_output_config(LLMBatchAnalysisOutput),
+        )
+
+        results = _parse_batch_llm_response(response, behaviour_db, len(user_inputs))
+        total_duration_ms = int((time.time() - start_time) * 1000)
+
+        if results is None:
+            logger.warning(
+                "LLM batch did not return a valid analysis",
+                extra={
+                    "event": "llm_batch_analysis_failed",
+                    "reason": "invalid_structured_output",
+                    "duration_ms": total_duration_ms,
+                },
+            )
+            return None
+
+        logger.info(
+            "Batched LLM analysis successful",
+            extra={
+                "event": "llm_batch_analysis_complete",
+                "batch_size": len(user_inputs),
+                "valid_results": sum(1 for r in results if r is not None),
+                "total_duration_ms": total_duration_ms,
+                "source": "adk",
+            },
+        )
+        return results
+
+    except Exception as e:
+        logger.warning(
+            "Batched LLM analysis failed: %s",
+            str(e)[:200],
+            extra={
+                "event": "llm_batch_analysis_error",
+                "error_type": type(e).__name__,
+                "duration_ms": int((time.time() - start_time) * 1000),
+            },
+        )
+        return None
+
+
 def _build_memory_context(user_memory: UserMemory) -> str:
     """
     Build a context string from user memory for the LLM.
 
+    The string is memoized on the memory's fingerprint, so repeated prompts
+    for unchanged memories reuse the same context.
+
     Args:
         user_memory: UserMemory instance containing user's goals, streaks, and history.
 
     Returns:
         str: Formatted context string summarizing user's state.
     """
+    return _memory_context_from_fingerprint(user_memory.fingerprint())
+
+
+@functools.lru_cache(maxsize=256)
+def _memory_context_from_fingerprint(fingerprint: MemoryFingerprint) -> str:
+    """
+    Format a memory fingerprint (see UserMemory.fingerprint) as LLM context.
+
+    Args:
+        fingerprint: Goal descriptions, streak tuples and struggle tuples.
+
+    Returns:
+        str: Formatted context string summarizing user's state.
+    """
+    goals, streaks, struggles = fingerprint
     context_parts = []
 
     # Add goals
-    if hasattr(user_memory, "goals") and user_memory.goals:
-        goals_text = ", ".join(g.description for g in user_memory.goals)
-        context_parts.append(f"Goals: {goals_text}")
+    if goals:
+        context_parts.append(f"Goals: {', '.join(goals)}")
 
     # Add streaks
-    if hasattr(user_memory, "streaks") and user_memory.streaks:
-        streak_count = len(user_memory.streaks)
-        active_streaks = sum(1 for s in user_memory.streaks.values() if s.current > 0)
-        context_parts.append(f"Streaks: {active_streaks}/{streak_count} active")
+    if streaks:
+        active_streaks = sum(1 for _, current, _ in streaks if current > 0)
+        context_parts.append(f"Streaks: {active_streaks}/{len(streaks)} active")
 
     # Add struggles
-    if hasattr(user_memory, "struggles") and user_memory.struggles:
-        struggle_count = len(user_memory.struggles)
-        context_parts.append(f"Recorded struggles: {struggle_count}")
+    if struggles:
+        context_parts.append(f"Recorded struggles: {len(struggles)}")
 
     return "\n".join(context_parts) if context_parts else "No prior context available"
@@ -10,6 +10,7 @@ and retrieving user state without mixing in business logic or behaviour analysis
 
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal, Optional
@@ -31,6 +32,25 @@ logger = logging.getLogger(__name__)
 # Maximum character length for truncating conversation content in context building
 MAX_CONVERSATION_CONTEXT_LENGTH = 200
 
+# Hashable (goals, streaks, struggles) snapshot returned by UserMemory.fingerprint
+MemoryFingerprint = tuple[
+    tuple[str, ...], tuple[tuple[str, int, int], ...], tuple[tuple[str, int], ...]
+]
+
+# One-step progressions applied by UserProfile.update_from_interactions;
+# levels not listed here (already at the top, or unrecognised) stay unchanged
+_NEXT_ENGAGEMENT_LEVEL = {"low": "medium", "medium": "high"}
+_NEXT_LEARNING_SPEED = {"slow": "moderate", "moderate": "fast"}
+
+
+def _advance_level(progression: dict[str, str], level: str, steps: int) -> str:
+    """Move level up to steps times along progression, stopping at its end."""
+    for _ in range(steps):
+        if level not in progression:
+            break
+        level = progression[level]
+    return level
+
 
 class UserProfile:
     """
@@ -47,6 +67,14 @@ class UserProfile:
         learning_speed (str): How quickly user adopts suggestions ("fast", "moderate", "slow").
     """
 
+    __slots__ = (
+        "motivation_style",
+        "risk_tolerance",
+        "engagement_level",
+        "preferred_tone",
+        "learning_speed",
+    )
+
     def __init__(
         self,
         motivation_style: str = "unknown",
@@ -74,13 +102,8 @@ class UserProfile:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UserProfile":
         """Deserialize UserProfile from dictionary."""
-        return cls(
-            motivation_style=data.get("motivation_style", "unknown"),
-            risk_tolerance=data.get("risk_tolerance", "medium"),
-            engagement_level=data.get("engagement_level", "medium"),
-            preferred_tone=data.get("preferred_tone", "supportive"),
-            learning_speed=data.get("learning_speed", "moderate"),
-        )
+        # Missing keys fall back to the __init__ defaults; unknown keys are ignored
+        return cls(**{k: v for k, v in data.items() if k in cls.__slots__})
 
     def update_from_interaction(self, outcome: dict[str, Any]) -> None:
         """
@@ -90,19 +113,41 @@ class UserProfile:
             outcome: Dictionary containing interaction feedback like success rate,
                     response_quality, engagement_indicators.
         """
+        self.update_from_interactions((outcome,))
+
+    def update_from_interactions(self, outcomes: Iterable[dict[str, Any]]) -> None:
+        """
+        Update profile based on several interaction outcomes at once.
+
+        Equivalent to calling update_from_interaction once per outcome, but
+        counts the engaged and successful outcomes first and then advances
+        each level by that many steps.
+
+        Args:
+            outcomes: Interaction feedback dictionaries, as accepted by
+                update_from_interaction.
+
+        Example:
+            >>> profile = UserProfile(engagement_level="low")
+            >>> profile.update_from_interactions([{"engaged": True}] * 3)
+            >>> profile.engagement_level
+            'high'
+        """
+        engaged = 0
+        successful = 0
+        for outcome in outcomes:
+            engaged += bool(outcome.get("engaged", False))
+            successful += bool(outcome.get("intervention_successful", False))
+
         # Update engagement level based on interaction frequency
-        if outcome.get("engaged", False):
-            if self.engagement_level == "low":
-                self.engagement_level = "medium"
-            elif self.engagement_level == "medium":
-                self.engagement_level = "high"
+        self.engagement_level = _advance_level(
+            _NEXT_ENGAGEMENT_LEVEL, self.engagement_level, engaged
+        )
 
         # Update learning speed based on intervention success
-        if outcome.get("intervention_successful", False):
-            if self.learning_speed == "slow":
-                self.learning_speed = "moderate"
-            elif self.learning_speed == "moderate":
-                self.learning_speed = "fast"
+        self.learning_speed = _advance_level(
+            _NEXT_LEARNING_SPEED, self.learning_speed, successful
+        )
 
 
 class UserMemory:
@@ -645,6 +690,28 @@ class UserMemory:
 
         return "\n".join(context_parts)
 
+    def fingerprint(self) -> MemoryFingerprint:
+        """
+        Return a hashable snapshot of the goals, streaks and struggles.
+
+        Memories with equal fingerprints yield the same LLM memory context, so
+        the fingerprint can key caches even though UserMemory itself is mutable.
+
+        Returns:
+            tuple: (goal descriptions, (name, current, best) per streak,
+                   (description, count) per struggle).
+
+        Example:
+            >>> memory = UserMemory(user_id="user123")
+            >>> memory.fingerprint()
+            ((), (), ())
+        """
+        return (
+            tuple(g.description for g in self.goals),
+            tuple((name, s.current, s.best) for name, s in self.streaks.items()),
+            tuple((s.description, s.count) for s in self.struggles),
+        )
+
     def record_intervention_feedback(
         self,
         principle_id: str,
@@ -667,6 +734,33 @@ class UserMemory:
             >>> feedback = memory.intervention_feedback["friction_increase"]
             >>> print(f"Success rate: {feedback['successes']}/{feedback['total']}")
         """
+        self.record_intervention_feedback_bulk(
+            principle_id, int(success), int(not success)
+        )
+
+    def record_intervention_feedback_bulk(
+        self,
+        principle_id: str,
+        successes: int,
+        failures: int,
+    ) -> None:
+        """
+        Record several intervention outcomes for one principle at once.
+
+        Equivalent to calling record_intervention_feedback once per outcome,
+        but updates the counts and success rate a single time.
+
+        Args:
+            principle_id: The ID of the principle used.
+            successes: Number of successful interventions to add.
+            failures: Number of unsuccessful interventions to add.
+
+        Example:
+            >>> memory = UserMemory(user_id="user123")
+            >>> memory.record_intervention_feedback_bulk("friction_increase", 3, 1)
+            >>> memory.intervention_feedback["friction_increase"].success_rate
+            0.75
+        """
         if principle_id not in self.intervention_feedback:
             self.intervention_feedback[principle_id] = InterventionFeedback(
                 successes=0,
@@ -676,15 +770,13 @@ class UserMemory:
             )
 
         feedback = self.intervention_feedback[principle_id]
-        feedback.total += 1
-
-        if success:
-            feedback.successes += 1
-        else:
-            feedback.failures += 1
+        feedback.successes += successes
+        feedback.failures += failures
+        feedback.total += successes + failures
 
         # Calculate success rate
-        feedback.success_rate = feedback.successes / feedback.total
+        if feedback.total:
+            feedback.success_rate = feedback.successes / feedback.total
 
     def get_most_effective_principles(
         self, min_uses: int = 2
@@ -6,7 +6,8 @@ used throughout the application, promoting type safety and reducing
 runtime errors.
 """
 
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
@@ -20,6 +21,9 @@ class ConversationRole(str, Enum):
     SYSTEM = "system"
 
 
+_ROLE_BY_VALUE = {role.value: role for role in ConversationRole}
+
+
 class BehaviourPrincipleEnum(str, Enum):
     """Enumeration of supported behavioural science principles."""
 
@@ -33,9 +37,50 @@ class BehaviourPrincipleEnum(str, Enum):
     MICRO_HABITS = "micro_habits"
 
 
+# (millisecond, ISO string) of the most recent _now_iso call
+_last_now_iso: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Get the current local time in ISO format, formatted at most once per millisecond.
+
+    Models created in a burst share one formatted timestamp instead of each
+    reading the clock through datetime.now() and calling isoformat().
+
+    Returns:
+        str: The current time, accurate to the millisecond, in ISO format.
+    """
+    global _last_now_iso
+    now = time.time()
+    millis = int(now * 1000)
+    if millis != _last_now_iso[0]:
+        _last_now_iso = (millis, datetime.fromtimestamp(now).isoformat())
+    return _last_now_iso[1]
+
+
+def _timestamp_or_now(data: dict[str, Any], key: str) -> str:
+    """
+    Read a timestamp field, defaulting to the current time only when absent.
+
+    Unlike data.get(key, _now_iso()), the clock is not read
+    and formatted when the field is present.
+
+    Args:
+        data: Serialized model data.
+        key: Name of the timestamp field.
+
+    Returns:
+        str: The stored timestamp, or the current time in ISO format.
+    """
+    return data[key] if key in data else _now_iso()
+
+
 class BaseModel:
     """Base model with common functionality for all domain models."""
 
+    __slots__ = ()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         raise NotImplementedError("Subclasses must implement to_dict method.")
@@ -46,13 +91,13 @@ class BaseModel:
         raise NotImplementedError("Subclasses must implement from_dict method.")
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Goal(BaseModel):
     """Represents a user's financial goal."""
 
     description: str
     target: Optional[str] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
     completed: bool = False
 
     def to_dict(self) -> dict[str, Any]:
@@ -70,18 +115,18 @@ class Goal(BaseModel):
         return cls(
             description=data.get("description", ""),
             target=data.get("target"),
-            created_at=data.get("created_at", datetime.now().isoformat()),
+            created_at=_timestamp_or_now(data, "created_at"),
             completed=data.get("completed", False),
         )
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class StreakData(BaseModel):
     """Tracks streak information for a specific habit."""
 
     current: int = 0
     best: int = 0
-    last_updated: str = field(default_factory=lambda: datetime.now().isoformat())
+    last_updated: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -97,17 +142,17 @@ class StreakData(BaseModel):
         return cls(
             current=data.get("current", 0),
             best=data.get("best", 0),
-            last_updated=data.get("last_updated", datetime.now().isoformat()),
+            last_updated=_timestamp_or_now(data, "last_updated"),
         )
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Struggle(BaseModel):
     """Represents a recorded user struggle or challenge."""
 
     description: str
-    first_noted: str = field(default_factory=lambda: datetime.now().isoformat())
-    last_noted: str = field(default_factory=lambda: datetime.now().isoformat())
+    first_noted: str = field(default_factory=_now_iso)
+    last_noted: str = field(default_factory=_now_iso)
     count: int = 1
 
     def to_dict(self) -> dict[str, Any]:
@@ -122,7 +167,9 @@ class Struggle(BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Struggle":
         """Create Struggle from dictionary."""
-        timestamp = datetime.now().isoformat()
+        # Both dates default to the same moment; skip the clock if neither is needed
+        missing = "first_noted" not in data or "last_noted" not in data
+        timestamp = _now_iso() if missing else ""
         return cls(
             description=data.get("description", ""),
             first_noted=data.get("first_noted", timestamp),
@@ -131,7 +178,7 @@ class Struggle(BaseModel):
         )
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Intervention(BaseModel):
     """Represents a suggested intervention or action."""
 
@@ -151,19 +198,19 @@ class Intervention(BaseModel):
     def from_dict(cls, data: dict[str, Any]) -> "Intervention":
         """Create Intervention from dictionary."""
         return cls(
-            date=data.get("date", datetime.now().isoformat()),
+            date=_timestamp_or_now(data, "date"),
             intervention_type=data.get("type", "unknown"),
             description=data.get("description", ""),
         )
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class ConversationTurn(BaseModel):
     """Represents a single turn in the conversation history."""
 
     role: ConversationRole
     content: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
@@ -180,21 +227,18 @@ class ConversationTurn(BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ConversationTurn":
         """Create ConversationTurn from dictionary."""
-        role_str = data.get("role", "user")
-        try:
-            role = ConversationRole(role_str)
-        except ValueError:
-            role = ConversationRole.USER
+        # Unknown roles fall back to USER
+        role = _ROLE_BY_VALUE.get(data.get("role", "user"), ConversationRole.USER)
 
         return cls(
             role=role,
             content=data.get("content", ""),
-            timestamp=data.get("timestamp", datetime.now().isoformat()),
+            timestamp=_timestamp_or_now(data, "timestamp"),
             metadata=data.get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InterventionFeedback(BaseModel):
     """Tracks the effectiveness of a specific principle."""
 
@@ -215,15 +259,14 @@ class InterventionFeedback(BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "InterventionFeedback":
         """Create InterventionFeedback from dictionary."""
-        return cls(
-            successes=data.get("successes", 0),
-            failures=data.get("failures", 0),
-            total=data.get("total", 0),
-            success_rate=data.get("success_rate", 0.0),
-        )
+        # Every field has a default; keys from other schema versions are ignored
+        return cls(**{k: v for k, v in data.items() if k in _FEEDBACK_FIELDS})
+
 
+_FEEDBACK_FIELDS = frozenset(f.name for f in fields(InterventionFeedback))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BehaviouralPrinciple(BaseModel):
     """Represents a behavioural science principle from the knowledge base."""
 
@@ -233,6 +276,10 @@ class BehaviouralPrinciple(BaseModel):
     typical_triggers: list[str]
     interventions: list[str]
 
+    def __hash__(self) -> int:
+        """Hash by ID; the list fields are not hashable and equal principles share an ID."""
+        return hash(self.id)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -255,25 +302,35 @@ class BehaviouralPrinciple(BaseModel):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BehaviourDatabase(BaseModel):
     """Container for all behavioural principles."""
 
     version: str
     description: str
     principles: list[BehaviouralPrinciple]
+    _by_id: dict[str, BehaviouralPrinciple] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index the principles by ID; the first principle wins on duplicates."""
+        self._by_id = {p.id: p for p in reversed(self.principles)}
 
     def get_principle_by_id(self, principle_id: str) -> Optional[BehaviouralPrinciple]:
         """
         Get a principle by its ID.
 
+        The lookup uses an index built at construction, so replace the
+        database rather than mutating its principles list.
+
         Args:
             principle_id: The principle ID to search for.
 
         Returns:
             BehaviouralPrinciple or None: The principle if found, None otherwise.
         """
-        return next((p for p in self.principles if p.id == principle_id), None)
+        return self._by_id.get(principle_id)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -286,9 +343,9 @@ class BehaviourDatabase(BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "BehaviourDatabase":
         """Create BehaviourDatabase from dictionary."""
-        principles = [
-            BehaviouralPrinciple.from_dict(p) for p in data.get("principles", [])
-        ]
+        principles = list(
+            map(BehaviouralPrinciple.from_dict, data.get("principles", []))
+        )
         return cls(
             version=data.get("version", "1.0"),
             description=data.get("description", ""),
@@ -296,13 +353,13 @@ class BehaviourDatabase(BaseModel):
         )
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class BehaviourPattern(BaseModel):
     """Represents a detected behavioural pattern (e.g., end_of_month_overspending)."""
 
     detected: bool = False
     occurrences: int = 0
-    last_detected: str = field(default_factory=lambda: datetime.now().isoformat())
+    last_detected: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -318,11 +375,11 @@ class BehaviourPattern(BaseModel):
         return cls(
             detected=data.get("detected", False),
             occurrences=data.get("occurrences", 0),
-            last_detected=data.get("last_detected", datetime.now().isoformat()),
+            last_detected=_timestamp_or_now(data, "last_detected"),
         )
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class AnalysisResult(BaseModel):
     """Result of behaviour analysis."""
 
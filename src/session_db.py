@@ -2,9 +2,11 @@
 Session management utilities for ADK.
 
 This module provides utilities for creating session services using
-Google ADK's InMemorySessionService.
+Google ADK's InMemorySessionService. get_session_service shares one service
+per process; its sessions are held in memory until the process exits.
 """
 
+import functools
 import logging
 
 from google.adk.sessions import InMemorySessionService
@@ -33,3 +35,24 @@ def create_session_service() -> InMemorySessionService:
     """
     logger.info("Creating InMemorySessionService")
     return InMemorySessionService()
+
+
+@functools.lru_cache(maxsize=1)
+def get_session_service() -> InMemorySessionService:
+    """
+    Get the process-wide InMemorySessionService, creating it on first use.
+
+    Sharing one service lets sessions created by earlier calls be found
+    again, which a fresh service per call cannot do. The service keeps every
+    session it creates for the life of the process and never evicts them, so
+    memory grows with the number of users in a long-running process; call
+    get_session_service.cache_clear() to drop the service and its sessions.
+
+    Returns:
+        InMemorySessionService: The shared in-memory session service
+
+    Example:
+        >>> get_session_service() is get_session_service()
+        True
+    """
+    return create_session_service()
@@ -5,6 +5,13 @@ This module provides reusable test fixtures for creating sample data
 including behaviour databases, user memory instances, and test scenarios.
 """
 
+import functools
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Optional
+
 import pytest
 
 from src.config import load_env
@@ -17,9 +24,117 @@ from src.models import (
     Struggle,
 )
 
-# Load environment variables at test startup
+# Use the keyword fallback unless the shell opts in with HABIT_DISABLE_LLM=0;
+# set before load_env() so a value in .env cannot enable the LLM. Tests marked
+# llm and tests using the fake client re-enable it themselves
+os.environ.setdefault("HABIT_DISABLE_LLM", "1")
+
+# Load environment variables at test startup (existing values are kept)
 load_env()
 
+BEHAVIOUR_DB_PATH = Path(__file__).parent.parent / "data" / "behaviour_principles.json"
+
+
+@functools.lru_cache(maxsize=1)
+def get_test_behaviour_db() -> dict[str, Any]:
+    """
+    Load the real behaviour principles database, parsing it once per run.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return json.loads(BEHAVIOUR_DB_PATH.read_bytes())
+
+
+# Structured output returned by the fake GenAI client by default
+FAKE_LLM_ARGS = {
+    "principle_id": "friction_increase",
+    "reason": "User mentions easy access to food delivery",
+    "intervention_suggestions": [
+        "Delete food delivery apps",
+        "Remove saved payment info",
+    ],
+    "triggers_matched": ["food delivery", "stressed"],
+}
+
+
+def _fake_llm_response(args: dict[str, Any]) -> SimpleNamespace:
+    """Build a response shaped like GenerateContentResponse with JSON text."""
+    return SimpleNamespace(text=json.dumps(args))
+
+
+class FakeGenaiClient:
+    """
+    Stand-in for google.genai.Client that returns a canned response.
+
+    Each fixture installs its own subclass, so the class attributes below
+    (response, error, calls) are never shared between tests.
+    """
+
+    response: Any = _fake_llm_response(FAKE_LLM_ARGS)
+    error: Optional[Exception] = None
+    calls: list[dict[str, Any]] = []
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+
+    def _generate_content(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    @classmethod
+    def respond_with(cls, args: dict[str, Any]) -> None:
+        """Make subsequent calls return these arguments as JSON text."""
+        cls.response = _fake_llm_response(args)
+
+
+def _install_fake_client(
+    monkeypatch: pytest.MonkeyPatch, error: Optional[Exception] = None
+) -> type[FakeGenaiClient]:
+    """
+    Patch the LLM client to a fresh FakeGenaiClient subclass and enable it.
+
+    The on-disk response cache is switched off so canned fake answers never
+    land in ./.llm_cache.sqlite, where a later real run would replay them.
+    """
+    client_class = type(
+        "FakeGenaiClient", (FakeGenaiClient,), {"error": error, "calls": []}
+    )
+    monkeypatch.setattr("src.llm_client.Client", client_class)
+    monkeypatch.setattr("src.llm_client.get_api_key", lambda: "test_api_key")
+    monkeypatch.setenv("HABIT_DISABLE_LLM", "0")
+    monkeypatch.setenv("HABIT_LLM_CACHE", "0")
+    return client_class
+
+
+@pytest.fixture
+def fake_llm_success(monkeypatch: pytest.MonkeyPatch) -> type[FakeGenaiClient]:
+    """Fake GenAI client returning FAKE_LLM_ARGS as JSON text."""
+    return _install_fake_client(monkeypatch)
+
+
+@pytest.fixture
+def fake_llm_failure(monkeypatch: pytest.MonkeyPatch) -> type[FakeGenaiClient]:
+    """Fake GenAI client whose generate_content raises an API error."""
+    return _install_fake_client(monkeypatch, error=Exception("API Error"))
+
+
+@pytest.fixture(autouse=True)
+def enable_llm_for_llm_tests(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Let tests marked llm reach the real API, bypassing the response cache."""
+    if request.node.get_closest_marker("llm"):
+        monkeypatch.setenv("HABIT_DISABLE_LLM", "0")
+        monkeypatch.setenv("HABIT_LLM_CACHE", "0")
+
+
+@pytest.fixture(scope="session")
+def behaviour_db() -> dict[str, Any]:
+    """Session-wide copy of the real behaviour principles database."""
+    return get_test_behaviour_db()
+
 
 @pytest.fixture
 def sample_behaviour_db() -> dict:
@@ -83,7 +198,14 @@ def empty_memory() -> UserMemory:
 
 @pytest.fixture
 def populated_memory() -> UserMemory:
-    """Create a UserMemory instance with sample data."""
+    """
+    Create a UserMemory instance with sample data.
+
+    Built fresh for every test rather than copied from a session-scoped
+    baseline: copy.deepcopy of this memory is several times slower than
+    constructing it, and even a field-by-field dataclasses.replace clone is
+    about 1.5x slower.
+    """
     memory = UserMemory(user_id="test_user")
 
     # Add goals
@@ -10,6 +10,7 @@ import pytest
 from src.behaviour_engine import (
     _apply_adaptive_weighting,
     _calculate_confidence_score,
+    _match_keywords,
     analyse_behaviour,
     explain_principle,
     get_interventions,
@@ -428,3 +429,24 @@ class TestCalculateConfidenceScore:
 
         # 9/10 = 0.9, * 0.8 = 0.72, + 0.2 = 0.92, capped at 0.75
         assert confidence == 0.75
+
+
+class TestMatchKeywords:
+    """Tests for _match_keywords function."""
+
+    def test_reports_overlapping_keywords(self):
+        """Test that a keyword contained in another keyword is also reported."""
+        matched = _match_keywords("i keep ordering food delivery")
+
+        assert matched == {"friction_increase": ["delivery", "food delivery"]}
+
+    def test_same_text_can_match_several_principles(self):
+        """Test that one phrase counts for every principle listing it."""
+        matched = _match_keywords("it is difficult to maintain")
+
+        assert matched["commitment_devices"] == ["difficult to maintain"]
+        assert matched["friction_reduction"] == ["difficult to"]
+
+    def test_no_match_returns_empty_dict(self):
+        """Test that text without keywords yields no principles."""
+        assert _match_keywords("hello, how are you?") == {}
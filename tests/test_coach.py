@@ -5,6 +5,8 @@ This module tests the main coaching functions including response generation,
 session summaries, and interaction with the ADK agent.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from src.coach import (
@@ -124,6 +126,30 @@ class TestRunOnce:
         assert isinstance(response, str)
         assert len(response) > 0
 
+    @patch("src.coach.analyse_behaviour")
+    def test_run_once_reuses_precomputed_analysis(
+        self, mock_analyse, empty_memory, sample_behaviour_db
+    ):
+        """Test that a caller-supplied analysis skips re-analysis."""
+        analysis = {
+            "detected_principle_id": "friction_increase",
+            "reason": "Precomputed reason",
+            "intervention_suggestions": ["Delete food delivery apps"],
+            "triggers_matched": ["delivery"],
+            "source": "keyword",
+            "confidence": 0.75,
+        }
+
+        response = run_once(
+            "I keep ordering food delivery",
+            empty_memory,
+            sample_behaviour_db,
+            analysis=analysis,
+        )
+
+        mock_analyse.assert_not_called()
+        assert len(response) > 0
+
 
 class TestGenerateSessionSummary:
     """Tests for session summary generation."""
@@ -16,6 +16,7 @@ from src.config import (
     get_data_path,
     get_working_directory,
     is_kaggle_environment,
+    is_llm_disabled,
     load_env,
 )
 
@@ -41,6 +42,25 @@ class TestIsKaggleEnvironment:
             assert is_kaggle_environment() is True
 
 
+class TestIsLlmDisabled:
+    """Tests for is_llm_disabled function."""
+
+    def test_returns_false_when_unset(self):
+        """Test returns False when HABIT_DISABLE_LLM is not set."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert is_llm_disabled() is False
+
+    def test_returns_true_when_set_to_one(self):
+        """Test returns True when HABIT_DISABLE_LLM is "1"."""
+        with patch.dict(os.environ, {"HABIT_DISABLE_LLM": "1"}):
+            assert is_llm_disabled() is True
+
+    def test_returns_false_when_set_to_zero(self):
+        """Test returns False when HABIT_DISABLE_LLM is "0"."""
+        with patch.dict(os.environ, {"HABIT_DISABLE_LLM": "0"}):
+            assert is_llm_disabled() is False
+
+
 class TestGetDataPath:
     """Tests for get_data_path function."""
 
@@ -16,19 +16,19 @@ Metrics Implemented:
 - Latency: Time taken for analysis (when measured)
 """
 
-import json
+import asyncio
+import re
 import time
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Optional
 
 import pytest
 
-from src.behaviour_engine import analyse_behaviour
+from src.behaviour_engine import analyse_behaviour, analyse_behaviour_batch
 from src.coach import run_once
 from src.config import load_env
 from src.memory import UserMemory
-from src.models import Goal
+from src.models import Goal, StreakData
 
 load_env()
 
@@ -39,6 +39,21 @@ load_env()
 
 BAR_CHART_WIDTH = 10  # Width of bar charts in quality score visualization
 
+# Pre-rendered bars for every fill level (0..BAR_CHART_WIDTH), indexed by level
+QUALITY_BARS = tuple(
+    "█" * level + "░" * (BAR_CHART_WIDTH - level)
+    for level in range(BAR_CHART_WIDTH + 1)
+)
+
+# Intervention keyword checks, matched as substrings of the lowercased text
+_FRICTION_RE = re.compile(r"delete|remove|uninstall|obstacle|step")
+_HABIT_RE = re.compile(r"trigger|routine|alternative|replace|break")
+_ACTION_RE = re.compile(r"cancel|review|audit|list|schedule")
+_SPECIFIC_RE = re.compile(r"app|payment|card|account|website")
+_CONCRETE_ACTION_RE = re.compile(
+    r"delete|remove|set up|schedule|track|write|list|review|start|transfer"
+)
+
 
 # =============================================================================
 # Evaluation Metrics Class
@@ -55,8 +70,8 @@ class ScenarioResult:
     correct: bool
     confidence: float
     intervention_count: int
-    response_length: int
     source: str  # "keyword" or "llm"
+    response_length: Optional[int] = None  # None when no response was generated
     latency_ms: float = 0.0
     interventions: list[str] = field(default_factory=list)
 
@@ -121,8 +136,12 @@ class EvaluationMetrics:
         self.avg_interventions = (
             sum(r.intervention_count for r in self.results) / self.total_scenarios
         )
+        # Only scenarios that generated a response count towards response length
+        response_lengths = [
+            r.response_length for r in self.results if r.response_length is not None
+        ]
         self.avg_response_length = (
-            sum(r.response_length for r in self.results) / self.total_scenarios
+            sum(response_lengths) / len(response_lengths) if response_lengths else 0.0
         )
         self.avg_latency_ms = (
             sum(r.latency_ms for r in self.results) / self.total_scenarios
@@ -199,13 +218,6 @@ class EvaluationMetrics:
         print("=" * 80)
 
 
-def get_test_behaviour_db() -> dict[str, Any]:
-    """Load the behaviour principles database for testing."""
-    db_path = Path(__file__).parent.parent / "data" / "behaviour_principles.json"
-    with open(db_path, encoding="utf-8") as f:
-        return json.load(f)
-
-
 # =============================================================================
 # Test Scenarios Data - All 8 Behavioral Principles
 # =============================================================================
@@ -378,313 +390,223 @@ ALL_PRINCIPLE_IDS = [
     "temptation_bundling",
 ]
 
+# Set form of ALL_PRINCIPLE_IDS for membership checks
+VALID_PRINCIPLES = frozenset(ALL_PRINCIPLE_IDS)
 
-class TestAgentEvaluation:
-    """
-    Comprehensive agent evaluation test suite.
-
-    Tests measure:
-    1. Principle Detection Accuracy - Does the agent identify the correct behavioral principle?
-    2. Intervention Relevance - Are suggested interventions appropriate and actionable?
-    3. Response Quality - Is the coaching response helpful and personalized?
-    """
-
-    @pytest.fixture
-    def behaviour_db(self):
-        """Fixture to load behaviour database."""
-        return get_test_behaviour_db()
-
-    @pytest.fixture
-    def user_memory(self):
-        """Fixture to create fresh user memory for each test."""
-        memory = UserMemory(user_id="eval_user")
-        memory.goals = [
-            Goal(description="Save money monthly"),
-            Goal(description="Reduce impulse buying"),
-        ]
-        return memory
-
-    def test_scenario_1_habit_loops_stress_spending(self, behaviour_db, user_memory):
-        """
-        Scenario 1: Habit Loops - Stress-Triggered Spending
 
-        Expected Behavior:
-        - Detect: habit_loops principle
-        - Identify triggers: stress, evening, automatic
-        - Suggest: Trigger identification, alternative routines, reward replacement
+@dataclass(frozen=True)
+class ScenarioSpec:
+    """Expectations for one end-to-end coaching scenario."""
 
-        Evaluation Criteria:
-        - ✓ Correct principle detected
-        - ✓ At least 2 interventions provided
-        - ✓ Interventions mention breaking the loop or alternative behaviors
-        """
-        user_input = (
+    name: str
+    title: str
+    user_input: str
+    # None means any principle in VALID_PRINCIPLES (or none, if allow_none)
+    expected_principles: Optional[frozenset[str]] = None
+    allow_none: bool = False
+    min_interventions: int = 2
+    # Patterns the joined, lowercased interventions must match
+    intervention_patterns: tuple[tuple[re.Pattern[str], str], ...] = ()
+    # None skips the response length check
+    min_response_length: Optional[int] = 50
+    # At least one of these words must appear in the response, if given
+    response_principle_words: tuple[str, ...] = ()
+    streaks: dict[str, StreakData] = field(default_factory=dict)
+
+
+SCENARIO_SPECS = [
+    # Habit Loops: stress-triggered spending. Interventions should break the
+    # loop or offer alternative routines, and the response should explain it.
+    ScenarioSpec(
+        name="habit_loops_stress_spending",
+        title="Scenario 1: Habit Loops Detection",
+        user_input=(
             "Every evening after work, I automatically order food delivery when "
             "I'm stressed. It's become such a routine that I don't even think about it."
-        )
-
-        # Analyze behavior
-        analysis = analyse_behaviour(user_input, user_memory, behaviour_db)
-
-        # Get full response
-        response = run_once(user_input, user_memory, behaviour_db)
-
-        # Assertions - Principle Detection Accuracy
-        # Allow both habit_loops and friction_increase as valid detections
-        assert analysis["detected_principle_id"] in [
-            "habit_loops",
-            "friction_increase",
-        ], f"Expected habit_loops or friction_increase, got '{analysis['detected_principle_id']}'"
-        assert analysis["confidence"] > 0, f"Low confidence: {analysis['confidence']}"
-
-        # Assertions - Intervention Relevance
-        interventions = analysis["intervention_suggestions"]
-        assert (
-            len(interventions) >= 2
-        ), f"Expected at least 2 interventions, got {len(interventions)}"
-
-        # Check that interventions are about breaking loops or alternatives
-        intervention_text = " ".join(interventions).lower()
-        relevant_keywords = ["trigger", "routine", "alternative", "replace", "break"]
-        has_relevant_intervention = any(
-            keyword in intervention_text for keyword in relevant_keywords
-        )
-        assert (
-            has_relevant_intervention
-        ), "Interventions don't address habit loop breaking"
-
-        # Assertions - Response Quality
-        assert len(response) > 200, "Response too short to be helpful"
-        assert (
-            "habit" in response.lower() or "loop" in response.lower()
-        ), "Response doesn't explain the behavioral principle"
-
-        print("\n✓ Scenario 1 PASSED: Habit Loops Detection")
-        print(f"  Principle: {analysis['detected_principle_id']}")
-        print(f"  Confidence: {analysis['confidence']:.0%}")
-        print(f"  Interventions: {len(interventions)}")
-
-    def test_scenario_2_loss_aversion_streak_anxiety(self, behaviour_db, user_memory):
-        """
-        Scenario 2: Loss Aversion - Fear of Breaking Streak
-
-        Expected Behavior:
-        - Detect: loss_aversion principle
-        - Identify: Fear of losses, streak-related anxiety
-        - Suggest: Reframing losses, self-compassion, recovery strategies
-
-        Evaluation Criteria:
-        - ✓ Correct principle detected
-        - ✓ Interventions address fear/anxiety
-        - ✓ Response is empathetic and supportive
-        """
-        # Set up streak context
-        from src.models import StreakData
-
-        user_memory.streaks = {"no_impulse_buying": StreakData(current=15, best=30)}
-
-        user_input = (
+        ),
+        expected_principles=frozenset({"habit_loops", "friction_increase"}),
+        intervention_patterns=(
+            (_HABIT_RE, "Interventions don't address habit loop breaking"),
+        ),
+        min_response_length=200,
+        response_principle_words=("habit", "loop"),
+    ),
+    # Loss Aversion: fear of breaking a streak. Keyword fallback may detect a
+    # related principle, so any valid principle is accepted.
+    ScenarioSpec(
+        name="loss_aversion_streak_anxiety",
+        title="Scenario 2: Loss Aversion Detection",
+        user_input=(
             "I'm afraid to check my bank account because I might see I've "
             "overspent and broken my savings streak. The anxiety is overwhelming."
-        )
-
-        # Analyze behavior
-        analysis = analyse_behaviour(user_input, user_memory, behaviour_db)
-        response = run_once(user_input, user_memory, behaviour_db)
-
-        # Assertions - Principle Detection (flexible for keyword fallback)
-        # Ideally loss_aversion, but keyword fallback may detect related principles
-        assert analysis["detected_principle_id"] is not None, "No principle detected"
-        assert analysis["detected_principle_id"] in [
-            "loss_aversion",
-            "habit_loops",
-            "commitment_devices",
-            "micro_habits",
-            "friction_reduction",
-            "friction_increase",
-            "default_effect",
-            "temptation_bundling",
-        ], f"Invalid principle: '{analysis['detected_principle_id']}'"
-
-        # Assertions - Intervention Relevance
-        interventions = analysis["intervention_suggestions"]
-        assert (
-            len(interventions) >= 1
-        ), f"Expected at least 1 intervention, got {len(interventions)}"
-
-        # Assertions - Response Quality (should provide some guidance)
-        assert len(response) > 50, "Response too short to be helpful"
-
-        print("\n✓ Scenario 2 PASSED: Loss Aversion Detection")
-        print(f"  Principle: {analysis['detected_principle_id']}")
-        print(f"  Confidence: {analysis['confidence']:.0%}")
-
-    def test_scenario_3_friction_increase_one_click_shopping(
-        self, behaviour_db, user_memory
-    ):
-        """
-        Scenario 3: Friction Increase - One-Click Shopping Problem
-
-        Expected Behavior:
-        - Detect: friction_increase principle
-        - Identify: Too-easy access to spending
-        - Suggest: Adding obstacles, removing saved payment info, app deletion
-
-        Evaluation Criteria:
-        - ✓ Correct principle detected
-        - ✓ Interventions suggest adding friction/obstacles
-        - ✓ Suggestions are actionable and specific
-        """
-        user_input = (
+        ),
+        min_interventions=1,
+        streaks={"no_impulse_buying": StreakData(current=15, best=30)},
+    ),
+    # Friction Increase: one-click shopping. Interventions should add specific,
+    # actionable obstacles.
+    ScenarioSpec(
+        name="friction_increase_one_click_shopping",
+        title="Scenario 3: Friction Increase Detection",
+        user_input=(
             "Online shopping is too easy. I just click and buy without thinking. "
             "One-click ordering and saved payment info make impulse buying instant."
-        )
+        ),
+        expected_principles=frozenset({"friction_increase"}),
+        intervention_patterns=(
+            (_FRICTION_RE, "Interventions don't suggest adding friction"),
+            (_SPECIFIC_RE, "Interventions lack specific actionable steps"),
+        ),
+        min_response_length=None,
+    ),
+    # Micro Habits: overwhelmed by a large goal. The generic fallback (no
+    # principle) still helps, so None is accepted.
+    ScenarioSpec(
+        name="micro_habits_overwhelming_goals",
+        title="Scenario 4: Micro Habits Detection",
+        user_input=(
+            "Saving $1000 a month feels impossible and overwhelming. "
+            "I don't even know where to start. The goal is too big."
+        ),
+        allow_none=True,
+        min_interventions=1,
+    ),
+    # Default Effect: forgotten subscriptions. Interventions should suggest
+    # concrete actions such as cancelling or scheduled reviews.
+    ScenarioSpec(
+        name="default_effect_forgotten_subscriptions",
+        title="Scenario 5: Default Effect Detection",
+        user_input=(
+            "I'm still paying for subscriptions I never use. I keep forgetting "
+            "to cancel them even though I know I should."
+        ),
+        intervention_patterns=(
+            (_ACTION_RE, "Interventions don't suggest concrete actions"),
+        ),
+    ),
+]
 
-        # Analyze behavior
-        analysis = analyse_behaviour(user_input, user_memory, behaviour_db)
-        run_once(user_input, user_memory, behaviour_db)
 
-        # Assertions - Principle Detection
-        assert (
-            analysis["detected_principle_id"] == "friction_increase"
-        ), f"Expected 'friction_increase', got '{analysis['detected_principle_id']}'"
+@pytest.fixture(scope="module")
+def keyword_results(
+    behaviour_db: dict[str, Any],
+) -> dict[str, tuple[dict[str, Any], float]]:
+    """
+    Run every evaluation scenario through the keyword path once per module.
 
-        # Assertions - Intervention Relevance
-        interventions = analysis["intervention_suggestions"]
-        assert (
-            len(interventions) >= 2
-        ), f"Expected at least 2 interventions, got {len(interventions)}"
+    Keyword analysis only reads streaks and struggles from memory, and the
+    evaluation memories set neither, so one pass can be shared by all the
+    keyword-mode tests. Benchmarks that need a fresh timed call must call
+    _analyse_behaviour_keyword themselves.
 
-        intervention_text = " ".join(interventions).lower()
-        suggests_friction = any(
-            keyword in intervention_text
-            for keyword in ["delete", "remove", "uninstall", "obstacle", "step"]
-        )
-        assert suggests_friction, "Interventions don't suggest adding friction"
+    Returns:
+        dict: Maps scenario id to (analysis result, latency in ms).
+    """
+    from src.behaviour_engine import _analyse_behaviour_keyword
 
-        # Check for specificity (actual actions, not just "try to reduce")
-        has_specific_action = any(
-            word in intervention_text
-            for word in ["app", "payment", "card", "account", "website"]
-        )
-        assert has_specific_action, "Interventions lack specific actionable steps"
+    results = {}
+    for scenario in EVALUATION_SCENARIOS:
+        memory = UserMemory(user_id=f"keyword_{scenario['id']}")
 
-        print("\n✓ Scenario 3 PASSED: Friction Increase Detection")
-        print(f"  Principle: {analysis['detected_principle_id']}")
-        print(f"  Interventions: {len(interventions)}")
+        start_time = time.time()
+        analysis = _analyse_behaviour_keyword(scenario["input"], memory, behaviour_db)
+        latency_ms = (time.time() - start_time) * 1000
 
-    def test_scenario_4_micro_habits_overwhelming_goals(
-        self, behaviour_db, user_memory
-    ):
-        """
-        Scenario 4: Micro Habits - Overwhelmed by Large Goals
+        results[scenario["id"]] = (analysis, latency_ms)
+    return results
 
-        Expected Behavior:
-        - Detect: micro_habits principle
-        - Identify: Feeling overwhelmed by scale
-        - Suggest: Breaking down goals, starting small, tiny wins
 
-        Evaluation Criteria:
-        - ✓ Correct principle detected
-        - ✓ Interventions suggest smaller, achievable steps
-        - ✓ Response encourages starting small
-        """
-        user_input = (
-            "Saving $1000 a month feels impossible and overwhelming. "
-            "I don't even know where to start. The goal is too big."
-        )
+@pytest.fixture(scope="session")
+def evaluation_goals() -> tuple[Goal, ...]:
+    """Goals given to every evaluation memory; shared, so never mutate them."""
+    return (
+        Goal(description="Save money monthly"),
+        Goal(description="Reduce impulse buying"),
+    )
 
-        # Analyze behavior
-        analysis = analyse_behaviour(user_input, user_memory, behaviour_db)
-        response = run_once(user_input, user_memory, behaviour_db)
-
-        # Assertions - Principle Detection (flexible for keyword fallback)
-        # Ideally micro_habits, but keyword fallback may detect other valid principles or None
-        # Accept any reasonable detection or even None (generic fallback still helps)
-        if analysis["detected_principle_id"] is not None:
-            assert analysis["detected_principle_id"] in [
-                "loss_aversion",
-                "habit_loops",
-                "commitment_devices",
-                "micro_habits",
-                "friction_reduction",
-                "friction_increase",
-                "default_effect",
-                "temptation_bundling",
-            ], f"Invalid principle: '{analysis['detected_principle_id']}'"
 
-        # Assertions - Intervention Relevance
-        interventions = analysis["intervention_suggestions"]
-        assert (
-            len(interventions) >= 1
-        ), f"Expected at least 1 intervention, got {len(interventions)}"
+class TestAgentEvaluation:
+    """
+    Comprehensive agent evaluation test suite.
 
-        # Response should provide some guidance
-        assert len(response) > 50, "Response too short to be helpful"
+    Tests measure:
+    1. Principle Detection Accuracy - Does the agent identify the correct behavioral principle?
+    2. Intervention Relevance - Are suggested interventions appropriate and actionable?
+    3. Response Quality - Is the coaching response helpful and personalized?
+    """
 
-        print("\n✓ Scenario 4 PASSED: Micro Habits Detection")
-        print(f"  Principle: {analysis['detected_principle_id']}")
+    @pytest.fixture
+    def user_memory(self, evaluation_goals):
+        """
+        Fixture to create fresh user memory for each test.
 
-    def test_scenario_5_default_effect_forgotten_subscriptions(
-        self, behaviour_db, user_memory
-    ):
+        The Goal objects are shared with other tests (nothing mutates goals);
+        the memory itself and its other containers are new per test because
+        run_once records interactions on it.
         """
-        Scenario 5: Default Effect - Unused Subscriptions
+        return UserMemory(user_id="eval_user", goals=list(evaluation_goals))
 
-        Expected Behavior:
-        - Detect: default_effect principle
-        - Identify: Inaction, status quo bias
-        - Suggest: Automation, scheduled reviews, cancellation actions
+    @pytest.mark.parametrize("spec", SCENARIO_SPECS, ids=lambda spec: spec.name)
+    def test_scenario(self, spec, behaviour_db, user_memory):
+        """
+        Evaluate one coaching scenario end to end.
 
         Evaluation Criteria:
-        - ✓ Correct principle detected
-        - ✓ Interventions suggest active changes or automation
-        - ✓ Response provides concrete next steps
+        - ✓ Detected principle is one the scenario accepts
+        - ✓ Enough interventions, matching the scenario's keyword groups
+        - ✓ Response is long enough and, where required, explains the principle
         """
-        user_input = (
-            "I'm still paying for subscriptions I never use. I keep forgetting "
-            "to cancel them even though I know I should."
-        )
+        user_memory.streaks = dict(spec.streaks)
 
-        # Analyze behavior
-        analysis = analyse_behaviour(user_input, user_memory, behaviour_db)
-        response = run_once(user_input, user_memory, behaviour_db)
+        # Analyze behavior, then build the full response from that analysis
+        analysis = analyse_behaviour(spec.user_input, user_memory, behaviour_db)
+        checks_response = (
+            spec.min_response_length is not None or spec.response_principle_words
+        )
+        if checks_response:
+            response = run_once(
+                spec.user_input, user_memory, behaviour_db, analysis=analysis
+            )
 
         # Assertions - Principle Detection
-        # Accept any valid principle detection - keyword fallback may not match ideal principle
-        # but can still provide valuable interventions
-        assert analysis["detected_principle_id"] is not None and analysis[
-            "detected_principle_id"
-        ] in [
-            "loss_aversion",
-            "habit_loops",
-            "commitment_devices",
-            "temptation_bundling",
-            "friction_reduction",
-            "friction_increase",
-            "default_effect",
-            "micro_habits",
-        ], f"Expected a valid principle, got '{analysis['detected_principle_id']}'"
+        detected = analysis["detected_principle_id"]
+        if detected is None:
+            assert spec.allow_none, "No principle detected"
+        else:
+            accepted = spec.expected_principles or VALID_PRINCIPLES
+            assert (
+                detected in accepted
+            ), f"Expected one of {sorted(accepted)}, got '{detected}'"
+            assert (
+                analysis["confidence"] > 0
+            ), f"Low confidence: {analysis['confidence']}"
 
         # Assertions - Intervention Relevance
         interventions = analysis["intervention_suggestions"]
-        assert (
-            len(interventions) >= 2
-        ), f"Expected at least 2 interventions, got {len(interventions)}"
-
-        intervention_text = " ".join(interventions).lower()
-        suggests_action = any(
-            keyword in intervention_text
-            for keyword in ["cancel", "review", "audit", "list", "schedule"]
+        assert len(interventions) >= spec.min_interventions, (
+            f"Expected at least {spec.min_interventions} interventions, "
+            f"got {len(interventions)}"
         )
-        assert suggests_action, "Interventions don't suggest concrete actions"
-
-        # Response should provide some guidance (flexible wording)
-        # May not have specific keywords in fallback mode but should still help
-        assert len(response) > 50, "Response too short to be helpful"
 
-        print("\n✓ Scenario 5 PASSED: Default Effect Detection")
-        print(f"  Principle: {analysis['detected_principle_id']}")
+        intervention_text = " ".join(interventions).lower()
+        for pattern, message in spec.intervention_patterns:
+            assert pattern.search(intervention_text), message
+
+        # Assertions - Response Quality (only when the scenario checks it)
+        if spec.min_response_length is not None:
+            assert (
+                len(response) > spec.min_response_length
+            ), "Response too short to be helpful"
+        if spec.response_principle_words:
+            response_lower = response.lower()
+            assert any(
+                word in response_lower for word in spec.response_principle_words
+            ), "Response doesn't explain the behavioral principle"
+
+        print(f"\n✓ {spec.title} PASSED")
+        print(f"  Principle: {detected}")
+        print(f"  Confidence: {analysis['confidence']:.0%}")
+        print(f"  Interventions: {len(interventions)}")
 
 
 class TestEvaluationSummary:
@@ -695,7 +617,7 @@ class TestEvaluationSummary:
     for the agent's performance documentation.
     """
 
-    def test_aggregate_evaluation_metrics(self):
+    def test_aggregate_evaluation_metrics(self, behaviour_db, evaluation_goals):
         """
         Run all 5 evaluation scenarios and generate summary metrics.
 
@@ -705,8 +627,6 @@ class TestEvaluationSummary:
         - Average response length
         - Average confidence score
         """
-        behaviour_db = get_test_behaviour_db()
-
         test_cases = [
             {
                 "name": "Habit Loops",
@@ -735,16 +655,43 @@ class TestEvaluationSummary:
             },
         ]
 
-        results = []
-        for test_case in test_cases:
-            memory = UserMemory(user_id=f"eval_{test_case['name']}")
-            memory.goals = [
-                Goal(description="Save money monthly"),
-                Goal(description="Reduce impulse buying"),
-            ]
+        # Only user_id differs between scenarios; the goals are shared
+        memories = [
+            UserMemory(
+                user_id=f"eval_{test_case['name']}", goals=list(evaluation_goals)
+            )
+            for test_case in test_cases
+        ]
 
-            analysis = analyse_behaviour(test_case["input"], memory, behaviour_db)
-            response = run_once(test_case["input"], memory, behaviour_db)
+        # One LLM round-trip for all scenarios; falls back to per-item analysis
+        analyses = analyse_behaviour_batch(
+            [test_case["input"] for test_case in test_cases], memories, behaviour_db
+        )
+
+        # Each scenario has its own memory, so the responses can be generated
+        # concurrently; the LLM client still spaces out request start times.
+        async def _respond_all() -> list[str]:
+            return await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        run_once,
+                        test_case["input"],
+                        memory,
+                        behaviour_db,
+                        analysis=analysis,
+                    )
+                    for test_case, memory, analysis in zip(
+                        test_cases, memories, analyses, strict=True
+                    )
+                )
+            )
+
+        responses = asyncio.run(_respond_all())
+
+        results = []
+        for test_case, analysis, response in zip(
+            test_cases, analyses, responses, strict=True
+        ):
 
             correct = (
                 analysis["detected_principle_id"] == test_case["expected_principle"]
@@ -840,11 +787,7 @@ class TestExpandedEvaluation:
     Metrics collected using the EvaluationMetrics class.
     """
 
-    @pytest.fixture
-    def behaviour_db(self):
-        """Fixture to load behaviour database."""
-        return get_test_behaviour_db()
-
+    @pytest.mark.llm
     def test_all_scenarios_with_formal_metrics(self, behaviour_db):
         """
         Run all 13 evaluation scenarios with formal metrics collection.
@@ -852,10 +795,9 @@ class TestExpandedEvaluation:
         This test evaluates the agent across all 8 behavioral principles
         and collects comprehensive metrics for documentation.
 
-        Note: Latency measurements reflect end-to-end response time (run_once),
-        which includes behavior analysis, response generation, and memory updates.
-        The analysis is run a second time after response generation to collect
-        detection metrics, since run_once() doesn't return the analysis result.
+        Note: Latency measurements reflect end-to-end response time, which
+        includes behavior analysis, response generation, and memory updates.
+        The analysis is passed to run_once() so it is only computed once.
         """
         metrics = EvaluationMetrics()
 
@@ -868,12 +810,11 @@ class TestExpandedEvaluation:
 
             # Measure latency for the full agent response (end-to-end user experience)
             start_time = time.time()
-            response = run_once(scenario["input"], memory, behaviour_db)
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Analyze separately to get metrics (note: this runs analysis a second time,
-            # but is necessary since run_once doesn't return the analysis result)
             analysis = analyse_behaviour(scenario["input"], memory, behaviour_db)
+            response = run_once(
+                scenario["input"], memory, behaviour_db, analysis=analysis
+            )
+            latency_ms = (time.time() - start_time) * 1000
 
             # Create result
             result = ScenarioResult(
@@ -917,7 +858,7 @@ class TestExpandedEvaluation:
 
         # Check principle coverage - all 8 principles should be tested
         tested_principles = set(metrics.principle_coverage.keys())
-        expected_principles = set(ALL_PRINCIPLE_IDS)
+        expected_principles = VALID_PRINCIPLES
         assert (
             tested_principles == expected_principles
         ), f"Missing principles: {expected_principles - tested_principles}"
@@ -990,19 +931,7 @@ class TestExpandedEvaluation:
             keyword_score = min(keyword_matches / 2, 2)
 
             # 3. Specificity - contains concrete actions (max 1 point)
-            specificity_keywords = [
-                "delete",
-                "remove",
-                "set up",
-                "schedule",
-                "track",
-                "write",
-                "list",
-                "review",
-                "start",
-                "transfer",
-            ]
-            has_specific = any(kw in intervention_text for kw in specificity_keywords)
+            has_specific = bool(_CONCRETE_ACTION_RE.search(intervention_text))
             specificity_score = 1 if has_specific else 0
 
             total_score = count_score + keyword_score + specificity_score
@@ -1022,9 +951,9 @@ class TestExpandedEvaluation:
         print("🎯 INTERVENTION QUALITY SCORES")
         print("=" * 60)
         for qs in quality_scores:
-            bar = "█" * int(qs["percentage"] * BAR_CHART_WIDTH) + "░" * (
-                BAR_CHART_WIDTH - int(qs["percentage"] * BAR_CHART_WIDTH)
-            )
+            bar = QUALITY_BARS[
+                min(int(qs["percentage"] * BAR_CHART_WIDTH), BAR_CHART_WIDTH)
+            ]
             print(f"  {qs['scenario'][:30]:<32} [{bar}] {qs['percentage']:.0%}")
         print("-" * 60)
         print(f"  Average Quality Score: {avg_quality:.1%}")
@@ -1047,32 +976,18 @@ class TestModeComparison:
     detection methods to demonstrate the adaptive dual-path architecture.
     """
 
-    @pytest.fixture
-    def behaviour_db(self):
-        """Fixture to load behaviour database."""
-        return get_test_behaviour_db()
-
-    def test_keyword_mode_baseline(self, behaviour_db):
+    @pytest.mark.keyword
+    def test_keyword_mode_baseline(self, keyword_results):
         """
         Establish baseline performance for keyword-based detection.
 
         This test runs scenarios through the keyword fallback path
         and documents expected performance characteristics.
         """
-        from src.behaviour_engine import _analyse_behaviour_keyword
-
         metrics = EvaluationMetrics()
 
         for scenario in EVALUATION_SCENARIOS:
-            memory = UserMemory(user_id=f"keyword_{scenario['id']}")
-            memory.goals = [Goal(description="Save money monthly")]
-
-            start_time = time.time()
-            # Use keyword analysis directly
-            analysis = _analyse_behaviour_keyword(
-                scenario["input"], memory, behaviour_db
-            )
-            latency_ms = (time.time() - start_time) * 1000
+            analysis, latency_ms = keyword_results[scenario["id"]]
 
             result = ScenarioResult(
                 name=scenario["name"],
@@ -1082,13 +997,14 @@ class TestModeComparison:
                 == scenario["expected_principle"],
                 confidence=analysis["confidence"],
                 intervention_count=len(analysis["intervention_suggestions"]),
-                response_length=0,  # Not measuring response in this test
                 source="keyword",
                 latency_ms=latency_ms,
+                interventions=analysis["intervention_suggestions"],
             )
             metrics.add_result(result)
 
         metrics.calculate_aggregate_metrics()
+        metrics.print_summary()
 
         print("\n" + "=" * 70)
         print("🔤 KEYWORD MODE BASELINE METRICS")
@@ -1103,6 +1019,12 @@ class TestModeComparison:
         # - Fast performance (target: <100ms latency)
         # - Accuracy varies depending on scenario match quality (minimum threshold: 25%)
         # - See EVALUATION_RESULTS.md for current observed accuracy metrics
+        assert (
+            metrics.total_scenarios == 13
+        ), f"Expected 13 scenarios, got {metrics.total_scenarios}"
+        assert (
+            metrics.detection_accuracy >= 0.25
+        ), f"Accuracy too low: {metrics.detection_accuracy:.1%}"
         assert (
             metrics.avg_latency_ms < 100
         ), f"Keyword mode too slow: {metrics.avg_latency_ms:.1f}ms"
@@ -1111,6 +1033,12 @@ class TestModeComparison:
             metrics.avg_interventions >= 2
         ), f"Too few interventions: {metrics.avg_interventions:.1f}"
 
+        tested_principles = set(metrics.principle_coverage.keys())
+        assert (
+            tested_principles == VALID_PRINCIPLES
+        ), f"Missing principles: {VALID_PRINCIPLES - tested_principles}"
+
+    @pytest.mark.llm
     def test_detection_source_tracking(self, behaviour_db):
         """
         Verify that detection source (llm/keyword) is correctly tracked.
@@ -1191,16 +1119,14 @@ class TestLatencyBenchmarks:
     of the behavior analysis system.
     """
 
-    @pytest.fixture
-    def behaviour_db(self):
-        """Fixture to load behaviour database."""
-        return get_test_behaviour_db()
-
+    @pytest.mark.keyword
     def test_keyword_analysis_latency(self, behaviour_db):
         """
         Benchmark keyword-based analysis latency.
 
         Target: < 100ms for keyword analysis
+
+        Deliberately times fresh calls instead of reusing keyword_results.
         """
         from src.behaviour_engine import _analyse_behaviour_keyword
 
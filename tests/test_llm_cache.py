@@ -0,0 +1,108 @@
+"""
+Tests for the on-disk LLM analysis cache.
+
+This module tests cache key construction, round-tripping results through
+SQLite, and the HABIT_LLM_CACHE switch.
+"""
+
+import pytest
+
+from src import llm_cache
+from src.llm_client import analyse_behaviour_with_llm
+from src.memory import UserMemory
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """
+    Run each test with an empty, enabled cache file in a temporary directory.
+
+    Request it after the fake client fixtures, which turn the cache off.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HABIT_LLM_CACHE", "1")
+    return tmp_path
+
+
+class TestCacheKey:
+    """Tests for make_key."""
+
+    def test_same_request_same_key(self, sample_behaviour_db):
+        """Test that identical requests hash to the same key."""
+        key_a = llm_cache.make_key("prompt", "model", sample_behaviour_db)
+        key_b = llm_cache.make_key("prompt", "model", sample_behaviour_db)
+
+        assert key_a == key_b
+
+    def test_prompt_and_model_change_key(self, sample_behaviour_db):
+        """Test that the prompt and the model both affect the key."""
+        base = llm_cache.make_key("prompt", "model", sample_behaviour_db)
+
+        assert llm_cache.make_key("other", "model", sample_behaviour_db) != base
+        assert llm_cache.make_key("prompt", "other", sample_behaviour_db) != base
+
+    def test_generation_config_changes_key(self, sample_behaviour_db):
+        """Test that generation settings such as temperature affect the key."""
+        base = llm_cache.make_key(
+            "prompt", "model", sample_behaviour_db, {"temperature": 0.3}
+        )
+
+        assert (
+            llm_cache.make_key(
+                "prompt", "model", sample_behaviour_db, {"temperature": 0.7}
+            )
+            != base
+        )
+
+    def test_principles_change_key(self, sample_behaviour_db):
+        """Test that a different principle set changes the key."""
+        base = llm_cache.make_key("prompt", "model", sample_behaviour_db)
+        reduced_db = {"principles": sample_behaviour_db["principles"][:1]}
+
+        assert llm_cache.make_key("prompt", "model", reduced_db) != base
+
+
+class TestCacheStorage:
+    """Tests for get and put."""
+
+    def test_miss_returns_none(self, cache_dir):
+        """Test that an unknown key is a miss."""
+        assert llm_cache.get("missing") is None
+
+    def test_put_then_get_round_trip(self, cache_dir):
+        """Test that stored results are returned unchanged."""
+        result = {"detected_principle_id": "loss_aversion", "confidence": 0.85}
+
+        llm_cache.put("key", result)
+
+        assert llm_cache.get("key") == result
+        assert (cache_dir / ".llm_cache.sqlite").exists()
+
+    def test_disabled_by_env(self, cache_dir, monkeypatch):
+        """Test that HABIT_LLM_CACHE=0 disables the cache."""
+        assert llm_cache.is_enabled()
+
+        monkeypatch.setenv("HABIT_LLM_CACHE", "0")
+
+        assert not llm_cache.is_enabled()
+
+
+class TestCachedAnalysis:
+    """Tests for cache use in analyse_behaviour_with_llm."""
+
+    def test_cache_hit_skips_llm(
+        self, fake_llm_success, cache_dir, sample_behaviour_db
+    ):
+        """Test that a repeated request is answered from the cache."""
+        memory = UserMemory(user_id="test_user")
+
+        first = analyse_behaviour_with_llm(
+            "I keep ordering food delivery", memory, sample_behaviour_db
+        )
+        second = analyse_behaviour_with_llm(
+            "I keep ordering food delivery", memory, sample_behaviour_db
+        )
+
+        assert len(fake_llm_success.calls) == 1
+        assert first == second
+        assert second["detected_principle_id"] == "friction_increase"
@@ -5,23 +5,22 @@ This module tests the LLM-based behaviour analysis functionality,
 including the primary LLM path and keyword-based fallback.
 """
 
-import json
-from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
-
-from src.behaviour_engine import _analyse_behaviour_keyword, analyse_behaviour
-from src.llm_client import _build_memory_context, analyse_behaviour_with_llm
+from unittest.mock import patch
+
+from src.behaviour_engine import (
+    _analyse_behaviour_keyword,
+    analyse_behaviour,
+    analyse_behaviour_batch,
+)
+from src.llm_client import (
+    _build_memory_context,
+    analyse_behaviour_batch_with_llm,
+    analyse_behaviour_with_llm,
+)
 from src.memory import UserMemory
 from src.models import Goal, StreakData, Struggle
 
 
-def get_test_behaviour_db():
-    """Load the actual behaviour database for testing."""
-    db_path = Path(__file__).parent.parent / "data" / "behaviour_principles.json"
-    with open(db_path, encoding="utf-8") as f:
-        return json.load(f)
-
-
 def assert_trigger_contains(triggers, keyword):
     """
     Helper function to check if any trigger contains the keyword.
@@ -39,9 +38,8 @@ def assert_trigger_contains(triggers, keyword):
 class TestKeywordFallback:
     """Tests for keyword-based behaviour analysis (fallback)."""
 
-    def test_friction_increase_detection(self):
+    def test_friction_increase_detection(self, behaviour_db):
         """Test that food delivery triggers friction_increase principle."""
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
 
         result = _analyse_behaviour_keyword(
@@ -54,10 +52,9 @@ class TestKeywordFallback:
         assert assert_trigger_contains(result["triggers_matched"], "delivery")
         assert len(result["intervention_suggestions"]) > 0
 
-    def test_loss_aversion_with_streaks(self):
+    def test_loss_aversion_with_streaks(self, behaviour_db):
         """Test that loss aversion is detected with streak context."""
 
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
         memory.streaks = {"savings_streak": StreakData(current=10, best=15)}
 
@@ -70,9 +67,8 @@ class TestKeywordFallback:
         assert result["detected_principle_id"] == "loss_aversion"
         assert len(result["intervention_suggestions"]) > 0
 
-    def test_habit_loops_detection(self):
+    def test_habit_loops_detection(self, behaviour_db):
         """Test that habit loop keywords are detected."""
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
 
         result = _analyse_behaviour_keyword(
@@ -86,9 +82,8 @@ class TestKeywordFallback:
             result["triggers_matched"], "every time"
         ) or assert_trigger_contains(result["triggers_matched"], "automatic")
 
-    def test_no_match_returns_generic(self):
+    def test_no_match_returns_generic(self, behaviour_db):
         """Test that no keyword match returns generic guidance."""
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
 
         result = _analyse_behaviour_keyword(
@@ -126,45 +121,29 @@ class TestLLMIntegration:
 
         assert "No prior context available" in context
 
-    @patch("src.llm_client.Client")
-    @patch("src.llm_client.get_api_key")
-    def test_llm_analysis_success(self, mock_get_api_key, mock_client_class):
-        """Test successful LLM analysis."""
-        # Mock API key
-        mock_get_api_key.return_value = "test_api_key"
-
-        # Mock the LLM response
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        # Create mock response with function call
-        mock_function_call = Mock()
-        mock_function_call.args = {
-            "principle_id": "friction_increase",
-            "reason": "User mentions easy access to food delivery",
-            "intervention_suggestions": [
-                "Delete food delivery apps",
-                "Remove saved payment info",
-            ],
-            "triggers_matched": ["food delivery", "stressed"],
-        }
+    def test_memory_context_reflects_memory_changes(self):
+        """Test that the memoized context follows changes to the memory."""
+        memory = UserMemory(user_id="test_user")
+        memory.streaks = {"savings": StreakData(current=5, best=10)}
 
-        mock_part = Mock()
-        mock_part.function_call = mock_function_call
+        assert "Streaks: 1/1 active" in _build_memory_context(memory)
 
-        mock_content = Mock()
-        mock_content.parts = [mock_part]
+        memory.streaks["savings"].current = 0
 
-        mock_candidate = Mock()
-        mock_candidate.content = mock_content
+        assert "Streaks: 0/1 active" in _build_memory_context(memory)
 
-        mock_response = Mock()
-        mock_response.candidates = [mock_candidate]
+    def test_memory_context_shared_for_equal_memories(self):
+        """Test that memories with equal fingerprints reuse one context string."""
+        memory_a = UserMemory(user_id="user_a")
+        memory_b = UserMemory(user_id="user_b")
+        memory_a.goals = [Goal(description="Save more money")]
+        memory_b.goals = [Goal(description="Save more money")]
 
-        mock_client.models.generate_content.return_value = mock_response
+        assert memory_a.fingerprint() == memory_b.fingerprint()
+        assert _build_memory_context(memory_a) is _build_memory_context(memory_b)
 
-        # Test the function
-        behaviour_db = get_test_behaviour_db()
+    def test_llm_analysis_success(self, fake_llm_success, behaviour_db):
+        """Test successful LLM analysis."""
         memory = UserMemory(user_id="test_user")
 
         result = analyse_behaviour_with_llm(
@@ -178,21 +157,8 @@ class TestLLMIntegration:
         assert len(result["intervention_suggestions"]) == 2
         assert "food delivery" in result["triggers_matched"]
 
-    @patch("src.llm_client.Client")
-    @patch("src.llm_client.get_api_key")
-    def test_llm_analysis_failure_returns_none(
-        self, mock_get_api_key, mock_client_class
-    ):
+    def test_llm_analysis_failure_returns_none(self, fake_llm_failure, behaviour_db):
         """Test that LLM failure returns None."""
-        # Mock API key
-        mock_get_api_key.return_value = "test_api_key"
-
-        # Mock client to raise exception
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.models.generate_content.side_effect = Exception("API Error")
-
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
 
         result = analyse_behaviour_with_llm(
@@ -203,12 +169,94 @@ class TestLLMIntegration:
 
         assert result is None
 
+    def test_llm_analysis_disabled_skips_client(
+        self, fake_llm_success, behaviour_db, monkeypatch
+    ):
+        """Test that HABIT_DISABLE_LLM=1 returns None without calling the API."""
+        monkeypatch.setenv("HABIT_DISABLE_LLM", "1")
+
+        result = analyse_behaviour_with_llm(
+            "I keep ordering food delivery",
+            UserMemory(user_id="test_user"),
+            behaviour_db,
+        )
+
+        assert result is None
+        assert fake_llm_success.calls == []
+
+    def test_llm_analysis_invalid_json_returns_none(
+        self, fake_llm_success, behaviour_db
+    ):
+        """Test that output not matching the analysis schema is rejected."""
+        fake_llm_success.respond_with({"principle_id": "friction_increase"})
+
+        result = analyse_behaviour_with_llm(
+            "I keep ordering food delivery",
+            UserMemory(user_id="test_user"),
+            behaviour_db,
+        )
+
+        assert result is None
+
+    def test_batch_llm_analysis_single_request(self, fake_llm_success, behaviour_db):
+        """Test that a batch is analysed with one request and parsed in order."""
+        fake_llm_success.respond_with(
+            {
+                "results": [
+                    {
+                        "principle_id": "friction_increase",
+                        "reason": "Easy access to delivery apps",
+                        "intervention_suggestions": ["Delete food delivery apps"],
+                        "triggers_matched": ["food delivery"],
+                    },
+                    {
+                        "principle_id": "not_a_principle",
+                        "reason": "Unknown",
+                        "intervention_suggestions": [],
+                        "triggers_matched": [],
+                    },
+                ]
+            }
+        )
+
+        memories = [UserMemory(user_id="user_a"), UserMemory(user_id="user_b")]
+        results = analyse_behaviour_batch_with_llm(
+            ["I keep ordering food delivery", "Something else"],
+            memories,
+            behaviour_db,
+        )
+
+        assert len(fake_llm_success.calls) == 1
+        prompt = fake_llm_success.calls[0]["contents"]
+        assert "1. I keep ordering food delivery" in prompt
+        assert "2. Something else" in prompt
+
+        assert results is not None
+        assert len(results) == 2
+        assert results[0]["detected_principle_id"] == "friction_increase"
+        assert results[0]["source"] == "adk"
+        assert results[1] is None
+
+    def test_batch_llm_analysis_count_mismatch_returns_none(
+        self, fake_llm_success, behaviour_db
+    ):
+        """Test that a batch response with the wrong result count is rejected."""
+        fake_llm_success.respond_with({"results": []})
+
+        result = analyse_behaviour_batch_with_llm(
+            ["I keep ordering food delivery"],
+            [UserMemory(user_id="test_user")],
+            behaviour_db,
+        )
+
+        assert result is None
+
 
 class TestAnalyseBehaviourIntegration:
     """Tests for the main analyse_behaviour function with LLM + fallback."""
 
     @patch("src.behaviour_engine.analyse_behaviour_with_llm")
-    def test_uses_llm_when_available(self, mock_llm_analysis):
+    def test_uses_llm_when_available(self, mock_llm_analysis, behaviour_db):
         """Test that LLM is used as primary method."""
         # Mock successful LLM response
         mock_llm_analysis.return_value = {
@@ -218,7 +266,6 @@ class TestAnalyseBehaviourIntegration:
             "triggers_matched": ["food delivery"],
         }
 
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
 
         result = analyse_behaviour(
@@ -235,12 +282,13 @@ class TestAnalyseBehaviourIntegration:
         assert result["intervention_suggestions"] == ["LLM suggestion"]
 
     @patch("src.behaviour_engine.analyse_behaviour_with_llm")
-    def test_falls_back_to_keywords_when_llm_fails(self, mock_llm_analysis):
+    def test_falls_back_to_keywords_when_llm_fails(
+        self, mock_llm_analysis, behaviour_db
+    ):
         """Test that keyword analysis is used when LLM fails."""
         # Mock LLM failure
         mock_llm_analysis.return_value = None
 
-        behaviour_db = get_test_behaviour_db()
         memory = UserMemory(user_id="test_user")
 
         result = analyse_behaviour(
@@ -255,3 +303,46 @@ class TestAnalyseBehaviourIntegration:
         # Verify result is from keyword fallback
         assert result["detected_principle_id"] == "friction_increase"
         assert assert_trigger_contains(result["triggers_matched"], "delivery")
+
+    @patch("src.behaviour_engine.analyse_behaviour_with_llm")
+    @patch("src.behaviour_engine.analyse_behaviour_batch_with_llm")
+    def test_batch_falls_back_per_item_when_batch_fails(
+        self, mock_batch_analysis, mock_llm_analysis, behaviour_db
+    ):
+        """Test that a failed batch request is retried one input at a time."""
+        mock_batch_analysis.return_value = None
+        mock_llm_analysis.return_value = None
+        inputs = ["I keep ordering food delivery", "I broke my streak and regret it"]
+        memories = [UserMemory(user_id="user_a"), UserMemory(user_id="user_b")]
+
+        results = analyse_behaviour_batch(inputs, memories, behaviour_db)
+
+        mock_batch_analysis.assert_called_once()
+        assert mock_llm_analysis.call_count == 2
+        assert [r["source"] for r in results] == ["keyword", "keyword"]
+        assert results[0]["detected_principle_id"] == "friction_increase"
+
+    @patch("src.behaviour_engine.analyse_behaviour_batch_with_llm")
+    def test_batch_uses_keywords_for_invalid_items(
+        self, mock_batch_analysis, behaviour_db
+    ):
+        """Test that items the batch could not classify use keyword analysis."""
+        mock_batch_analysis.return_value = [
+            {
+                "detected_principle_id": "habit_loops",
+                "reason": "LLM-detected reason",
+                "intervention_suggestions": ["LLM suggestion"],
+                "triggers_matched": ["every evening"],
+                "source": "adk",
+                "confidence": 0.85,
+            },
+            None,
+        ]
+        inputs = ["Every evening I order takeout", "I keep ordering food delivery"]
+        memories = [UserMemory(user_id="user_a"), UserMemory(user_id="user_b")]
+
+        results = analyse_behaviour_batch(inputs, memories, behaviour_db)
+
+        assert results[0]["reason"] == "LLM-detected reason"
+        assert results[1]["source"] == "keyword"
+        assert results[1]["detected_principle_id"] == "friction_increase"
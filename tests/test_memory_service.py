@@ -5,330 +5,355 @@ This module tests memory-related business logic including recording
 interactions, feedback tracking, and memory analysis operations.
 """
 
+import gc
+from math import isclose
+
+import pytest
+
+from src.memory import UserMemory
 from src.memory_service import MemoryService
+from src.models import InterventionFeedback
+
+# MemoryService methods called by several tests, resolved once
+_record = MemoryService.record_interaction
+_feedback = MemoryService.record_feedback
+_effectiveness = MemoryService.calculate_principle_effectiveness
+_usage_count = MemoryService.get_principle_usage_count
+_recent_struggles = MemoryService.get_recent_struggles
+
+
+def _bulk(memory, principle_id, outcomes):
+    """Record a sequence of outcomes for one principle with a single call."""
+    successes = sum(outcomes)
+    memory.record_intervention_feedback_bulk(
+        principle_id, successes, len(outcomes) - successes
+    )
+
+
+def _mem_with_feedback(feedback_spec):
+    """
+    Build a UserMemory whose feedback is set directly from (successes, failures).
+
+    Args:
+        feedback_spec: Maps principle ID to a (successes, failures) pair.
+
+    Returns:
+        UserMemory: Memory holding the corresponding InterventionFeedback entries.
+    """
+    return UserMemory(
+        user_id="test_user",
+        intervention_feedback={
+            principle_id: InterventionFeedback(
+                successes=successes,
+                failures=failures,
+                total=successes + failures,
+                success_rate=successes / (successes + failures),
+            )
+            for principle_id, (successes, failures) in feedback_spec.items()
+        },
+    )
+
+
+# Interaction outcomes shared by the record_interaction tests; never mutate them
+_OUTCOME_STREAK_SUCCESS = {
+    "type": "streak_update",
+    "streak_name": "no_food_delivery",
+    "success": True,
+}
+_OUTCOME_STREAK_FAIL = {
+    "type": "streak_update",
+    "streak_name": "no_food_delivery",
+    "success": False,
+}
+_OUTCOME_STRUGGLE_WEEKEND = {"type": "struggle", "description": "Weekend overspending"}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _no_gc():
+    """
+    Turn off the cyclic garbage collector while this module's tests run.
+
+    The memory dataclasses built here are freed by reference counting, so
+    collection passes only add overhead; GC is restored and run afterwards.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if was_enabled:
+        gc.enable()
+    gc.collect()
+
+
+# =============================================================================
+# MemoryService methods
+# =============================================================================
+
+
+def test_record_streak_success(empty_memory):
+    """Test recording a successful streak update."""
+    _record(empty_memory, _OUTCOME_STREAK_SUCCESS)
+
+    assert "no_food_delivery" in empty_memory.streaks
+    assert empty_memory.streaks["no_food_delivery"].current == 1
+    assert empty_memory.streaks["no_food_delivery"].best == 1
+
+
+def test_record_streak_failure(populated_memory):
+    """Test recording a failed streak (breaking streak)."""
+    # Existing streak has current=7
+    _record(populated_memory, _OUTCOME_STREAK_FAIL)
+
+    assert populated_memory.streaks["no_food_delivery"].current == 0
+    assert populated_memory.streaks["no_food_delivery"].best == 14  # Best unchanged
+
+
+def test_record_struggle_new(empty_memory):
+    """Test recording a new struggle."""
+    _record(empty_memory, _OUTCOME_STRUGGLE_WEEKEND)
+
+    assert len(empty_memory.struggles) == 1
+    assert empty_memory.struggles[0].description == "Weekend overspending"
+    assert empty_memory.struggles[0].count == 1
+
+
+def test_record_struggle_duplicate(populated_memory):
+    """Test recording a duplicate struggle increments count."""
+    initial_count = len(populated_memory.struggles)
+    _record(populated_memory, _OUTCOME_STRUGGLE_WEEKEND)
+
+    assert len(populated_memory.struggles) == initial_count  # No new struggle added
+    by_desc = {s.description: s for s in populated_memory.struggles}
+    assert by_desc["Weekend overspending"].count == 4  # Was 3, now 4
+
+
+def test_record_feedback_new_principle(empty_memory):
+    """Test recording feedback for a new principle."""
+    _feedback(empty_memory, "friction_increase", True)
+
+    assert "friction_increase" in empty_memory.intervention_feedback
+    feedback = empty_memory.intervention_feedback["friction_increase"]
+    assert feedback.successes == 1
+    assert feedback.total == 1
+    assert isclose(feedback.success_rate, 1.0)
+
+
+def test_record_feedback_existing_principle(populated_memory):
+    """Test recording additional feedback for existing principle."""
+    fb_map = populated_memory.intervention_feedback
+    initial_total = fb_map["friction_increase"].total
+
+    _feedback(populated_memory, "friction_increase", False)
+
+    feedback = fb_map["friction_increase"]
+    assert feedback.total == initial_total + 1
+    assert feedback.failures == 2  # Was 1, now 2
+    assert isclose(feedback.success_rate, 3 / 5)  # 3 successes out of 5 total
+
+
+def test_calculate_principle_effectiveness_existing(populated_memory):
+    """Test calculating effectiveness for a tracked principle."""
+    effectiveness = _effectiveness(populated_memory, "friction_increase")
+    assert isclose(effectiveness, 0.75)
+
+
+def test_calculate_principle_effectiveness_new(empty_memory):
+    """Test calculating effectiveness for an untracked principle."""
+    effectiveness = _effectiveness(empty_memory, "unknown_principle")
+    assert isclose(effectiveness, 0.5)  # Default neutral
+
+
+def test_get_recent_struggles(populated_memory):
+    """Test retrieving recent struggles."""
+    recent = _recent_struggles(populated_memory, limit=1)
+
+    assert len(recent) == 1
+    assert recent[0].description == "Impulse buying during sales"  # Most recent
+
+
+def test_get_recent_struggles_empty(empty_memory):
+    """Test retrieving struggles from empty memory."""
+    recent = _recent_struggles(empty_memory)
+    assert len(recent) == 0
+
+
+def test_get_active_streaks(populated_memory):
+    """Test retrieving active streaks."""
+    active = MemoryService.get_active_streaks(populated_memory)
+
+    assert len(active) == 1
+    assert "no_food_delivery" in active
+    assert active["no_food_delivery"].current == 7
+
+
+def test_get_broken_streaks(populated_memory):
+    """Test retrieving broken streaks."""
+    broken = MemoryService.get_broken_streaks(populated_memory)
+
+    assert len(broken) == 1
+    assert "daily_savings" in broken
+    assert broken["daily_savings"].current == 0
+    assert broken["daily_savings"].best == 30
+
+
+def test_get_principle_usage_count_existing(populated_memory):
+    """Test getting usage count for a tracked principle."""
+    count = _usage_count(populated_memory, "friction_increase")
+    assert count == 4
+
+
+def test_get_principle_usage_count_new(empty_memory):
+    """Test getting usage count for an untracked principle."""
+    count = _usage_count(empty_memory, "new_principle")
+    assert count == 0
 
 
-class TestMemoryService:
-    """Tests for MemoryService methods."""
-
-    def test_record_streak_success(self, empty_memory):
-        """Test recording a successful streak update."""
-        outcome = {
-            "type": "streak_update",
-            "streak_name": "no_food_delivery",
-            "success": True,
-        }
-        MemoryService.record_interaction(empty_memory, outcome)
-
-        assert "no_food_delivery" in empty_memory.streaks
-        assert empty_memory.streaks["no_food_delivery"].current == 1
-        assert empty_memory.streaks["no_food_delivery"].best == 1
-
-    def test_record_streak_failure(self, populated_memory):
-        """Test recording a failed streak (breaking streak)."""
-        # Existing streak has current=7
-        outcome = {
-            "type": "streak_update",
-            "streak_name": "no_food_delivery",
-            "success": False,
-        }
-        MemoryService.record_interaction(populated_memory, outcome)
-
-        assert populated_memory.streaks["no_food_delivery"].current == 0
-        assert populated_memory.streaks["no_food_delivery"].best == 14  # Best unchanged
-
-    def test_record_struggle_new(self, empty_memory):
-        """Test recording a new struggle."""
-        outcome = {
-            "type": "struggle",
-            "description": "Weekend overspending",
-        }
-        MemoryService.record_interaction(empty_memory, outcome)
-
-        assert len(empty_memory.struggles) == 1
-        assert empty_memory.struggles[0].description == "Weekend overspending"
-        assert empty_memory.struggles[0].count == 1
-
-    def test_record_struggle_duplicate(self, populated_memory):
-        """Test recording a duplicate struggle increments count."""
-        initial_count = len(populated_memory.struggles)
-        outcome = {
-            "type": "struggle",
-            "description": "Weekend overspending",
-        }
-        MemoryService.record_interaction(populated_memory, outcome)
-
-        assert len(populated_memory.struggles) == initial_count  # No new struggle added
-        struggle = next(
-            s
-            for s in populated_memory.struggles
-            if s.description == "Weekend overspending"
-        )
-        assert struggle.count == 4  # Was 3, now 4
-
-    def test_record_feedback_new_principle(self, empty_memory):
-        """Test recording feedback for a new principle."""
-        MemoryService.record_feedback(empty_memory, "friction_increase", True)
-
-        assert "friction_increase" in empty_memory.intervention_feedback
-        feedback = empty_memory.intervention_feedback["friction_increase"]
-        assert feedback.successes == 1
-        assert feedback.total == 1
-        assert feedback.success_rate == 1.0
-
-    def test_record_feedback_existing_principle(self, populated_memory):
-        """Test recording additional feedback for existing principle."""
-        initial_total = populated_memory.intervention_feedback[
-            "friction_increase"
-        ].total
-
-        MemoryService.record_feedback(populated_memory, "friction_increase", False)
-
-        feedback = populated_memory.intervention_feedback["friction_increase"]
-        assert feedback.total == initial_total + 1
-        assert feedback.failures == 2  # Was 1, now 2
-        assert feedback.success_rate == 3 / 5  # 3 successes out of 5 total
-
-    def test_calculate_principle_effectiveness_existing(self, populated_memory):
-        """Test calculating effectiveness for a tracked principle."""
-        effectiveness = MemoryService.calculate_principle_effectiveness(
-            populated_memory, "friction_increase"
-        )
-        assert effectiveness == 0.75
-
-    def test_calculate_principle_effectiveness_new(self, empty_memory):
-        """Test calculating effectiveness for an untracked principle."""
-        effectiveness = MemoryService.calculate_principle_effectiveness(
-            empty_memory, "unknown_principle"
-        )
-        assert effectiveness == 0.5  # Default neutral
-
-    def test_get_recent_struggles(self, populated_memory):
-        """Test retrieving recent struggles."""
-        recent = MemoryService.get_recent_struggles(populated_memory, limit=1)
-
-        assert len(recent) == 1
-        assert recent[0].description == "Impulse buying during sales"  # Most recent
-
-    def test_get_recent_struggles_empty(self, empty_memory):
-        """Test retrieving struggles from empty memory."""
-        recent = MemoryService.get_recent_struggles(empty_memory)
-        assert len(recent) == 0
-
-    def test_get_active_streaks(self, populated_memory):
-        """Test retrieving active streaks."""
-        active = MemoryService.get_active_streaks(populated_memory)
-
-        assert len(active) == 1
-        assert "no_food_delivery" in active
-        assert active["no_food_delivery"].current == 7
-
-    def test_get_broken_streaks(self, populated_memory):
-        """Test retrieving broken streaks."""
-        broken = MemoryService.get_broken_streaks(populated_memory)
-
-        assert len(broken) == 1
-        assert "daily_savings" in broken
-        assert broken["daily_savings"].current == 0
-        assert broken["daily_savings"].best == 30
-
-    def test_get_principle_usage_count_existing(self, populated_memory):
-        """Test getting usage count for a tracked principle."""
-        count = MemoryService.get_principle_usage_count(
-            populated_memory, "friction_increase"
-        )
-        assert count == 4
-
-    def test_get_principle_usage_count_new(self, empty_memory):
-        """Test getting usage count for an untracked principle."""
-        count = MemoryService.get_principle_usage_count(empty_memory, "new_principle")
-        assert count == 0
-
-
-class TestUserMemoryInterventionFeedback:
-    """Tests for UserMemory.record_intervention_feedback() method."""
-
-    def test_record_intervention_feedback_new_principle(self, empty_memory):
-        """Test creating new feedback entry for a principle."""
-        empty_memory.record_intervention_feedback("friction_increase", True)
-
-        assert "friction_increase" in empty_memory.intervention_feedback
-        feedback = empty_memory.intervention_feedback["friction_increase"]
-        assert feedback.successes == 1
-        assert feedback.failures == 0
-        assert feedback.total == 1
-        assert feedback.success_rate == 1.0
-
-    def test_record_intervention_feedback_increment_success(self, empty_memory):
-        """Test incrementing success counts correctly."""
-        empty_memory.record_intervention_feedback("loss_aversion", True)
-        empty_memory.record_intervention_feedback("loss_aversion", True)
-
-        feedback = empty_memory.intervention_feedback["loss_aversion"]
-        assert feedback.successes == 2
-        assert feedback.failures == 0
-        assert feedback.total == 2
-        assert feedback.success_rate == 1.0
-
-    def test_record_intervention_feedback_increment_failure(self, empty_memory):
-        """Test incrementing failure counts correctly."""
-        empty_memory.record_intervention_feedback("habit_loops", False)
-        empty_memory.record_intervention_feedback("habit_loops", False)
-
-        feedback = empty_memory.intervention_feedback["habit_loops"]
-        assert feedback.successes == 0
-        assert feedback.failures == 2
-        assert feedback.total == 2
-        assert feedback.success_rate == 0.0
-
-    def test_record_intervention_feedback_mixed_outcomes(self, empty_memory):
-        """Test calculating success_rate accurately with mixed outcomes."""
-        empty_memory.record_intervention_feedback("friction_increase", True)
-        empty_memory.record_intervention_feedback("friction_increase", True)
-        empty_memory.record_intervention_feedback("friction_increase", False)
-        empty_memory.record_intervention_feedback("friction_increase", True)
-
-        feedback = empty_memory.intervention_feedback["friction_increase"]
-        assert feedback.successes == 3
-        assert feedback.failures == 1
-        assert feedback.total == 4
-        assert feedback.success_rate == 0.75
-
-    def test_record_intervention_feedback_accumulation(self, empty_memory):
-        """Test multiple feedback recordings accumulate correctly."""
-        # Record 10 interventions with varying success
-        for i in range(10):
-            success = i % 3 != 0  # i % 3 != 0 gives 6 successes out of 10
-            empty_memory.record_intervention_feedback("test_principle", success)
-
-        feedback = empty_memory.intervention_feedback["test_principle"]
-        assert feedback.total == 10
-        assert feedback.successes == 6
-        assert feedback.failures == 4
-        assert feedback.success_rate == 0.6
-
-    def test_record_intervention_feedback_multiple_principles(self, empty_memory):
-        """Test tracking feedback for multiple principles independently."""
-        empty_memory.record_intervention_feedback("friction_increase", True)
-        empty_memory.record_intervention_feedback("loss_aversion", False)
-        empty_memory.record_intervention_feedback("friction_increase", True)
-
-        assert len(empty_memory.intervention_feedback) == 2
-        assert (
-            empty_memory.intervention_feedback["friction_increase"].success_rate == 1.0
-        )
-        assert empty_memory.intervention_feedback["loss_aversion"].success_rate == 0.0
-
-
-class TestUserMemoryMostEffectivePrinciples:
-    """Tests for UserMemory.get_most_effective_principles() method."""
-
-    def test_get_most_effective_principles_single_principle(self, empty_memory):
-        """Test filtering with a single principle meeting threshold."""
-        empty_memory.record_intervention_feedback("friction_increase", True)
-        empty_memory.record_intervention_feedback("friction_increase", True)
-
-        effective = empty_memory.get_most_effective_principles(min_uses=2)
-
-        assert len(effective) == 1
-        assert effective[0] == ("friction_increase", 1.0)
-
-    def test_get_most_effective_principles_sorting(self, empty_memory):
-        """Test correct sorting by success rate (descending)."""
-        # Principle 1: 100% success
-        empty_memory.record_intervention_feedback("principle_a", True)
-        empty_memory.record_intervention_feedback("principle_a", True)
-
-        # Principle 2: 75% success
-        empty_memory.record_intervention_feedback("principle_b", True)
-        empty_memory.record_intervention_feedback("principle_b", True)
-        empty_memory.record_intervention_feedback("principle_b", True)
-        empty_memory.record_intervention_feedback("principle_b", False)
-
-        # Principle 3: 50% success
-        empty_memory.record_intervention_feedback("principle_c", True)
-        empty_memory.record_intervention_feedback("principle_c", False)
-
-        effective = empty_memory.get_most_effective_principles(min_uses=2)
-
-        assert len(effective) == 3
-        assert effective[0][0] == "principle_a"
-        assert effective[0][1] == 1.0
-        assert effective[1][0] == "principle_b"
-        assert effective[1][1] == 0.75
-        assert effective[2][0] == "principle_c"
-        assert effective[2][1] == 0.5
-
-    def test_get_most_effective_principles_min_uses_filter(self, empty_memory):
-        """Test filtering by minimum usage threshold (min_uses parameter)."""
-        # Principle with 1 use (below threshold)
-        empty_memory.record_intervention_feedback("principle_low", True)
-
-        # Principle with 3 uses (meets threshold)
-        empty_memory.record_intervention_feedback("principle_high", True)
-        empty_memory.record_intervention_feedback("principle_high", True)
-        empty_memory.record_intervention_feedback("principle_high", False)
-
-        effective = empty_memory.get_most_effective_principles(min_uses=2)
-
-        assert len(effective) == 1
-        assert effective[0][0] == "principle_high"
-
-    def test_get_most_effective_principles_empty_list(self, empty_memory):
-        """Test returns empty list when no principles meet threshold."""
-        # Add a principle with only 1 use
-        empty_memory.record_intervention_feedback("test_principle", True)
-
-        effective = empty_memory.get_most_effective_principles(min_uses=5)
-
-        assert len(effective) == 0
-        assert effective == []
-
-    def test_get_most_effective_principles_no_feedback(self, empty_memory):
-        """Test returns empty list when no feedback has been recorded."""
-        effective = empty_memory.get_most_effective_principles(min_uses=1)
-
-        assert len(effective) == 0
-        assert effective == []
-
-    def test_get_most_effective_principles_correct_tuples(self, empty_memory):
-        """Test returns correct tuples of (principle_id, success_rate)."""
-        empty_memory.record_intervention_feedback("test_principle", True)
-        empty_memory.record_intervention_feedback("test_principle", False)
-
-        effective = empty_memory.get_most_effective_principles(min_uses=2)
-
-        assert len(effective) == 1
-        principle_id, success_rate = effective[0]
-        assert principle_id == "test_principle"
-        assert success_rate == 0.5
-        assert isinstance(principle_id, str)
-        assert isinstance(success_rate, float)
-
-    def test_get_most_effective_principles_default_min_uses(self, empty_memory):
-        """Test default min_uses parameter of 2."""
-        # Principle with 1 use (below default)
-        empty_memory.record_intervention_feedback("principle_one", True)
-
-        # Principle with 2 uses (meets default)
-        empty_memory.record_intervention_feedback("principle_two", True)
-        empty_memory.record_intervention_feedback("principle_two", True)
-
-        # Call without specifying min_uses (should use default of 2)
-        effective = empty_memory.get_most_effective_principles()
-
-        assert len(effective) == 1
-        assert effective[0][0] == "principle_two"
-
-    def test_get_most_effective_principles_with_existing_feedback(
-        self, populated_memory
-    ):
-        """Test with pre-populated memory containing feedback."""
-        # populated_memory already has friction_increase (0.75) and loss_aversion (0.5)
-        effective = populated_memory.get_most_effective_principles(min_uses=2)
-
-        assert len(effective) == 2
-        assert effective[0][0] == "friction_increase"
-        assert effective[0][1] == 0.75
-        assert effective[1][0] == "loss_aversion"
-        assert effective[1][1] == 0.5
+# =============================================================================
+# UserMemory.record_intervention_feedback()
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    ("outcomes", "expected"),
+    [
+        pytest.param([True], (1, 0, 1, 1.0), id="new_principle"),
+        pytest.param([True, True], (2, 0, 2, 1.0), id="increment_success"),
+        pytest.param([False, False], (0, 2, 2, 0.0), id="increment_failure"),
+        # i % 3 != 0 gives 6 successes out of 10
+        pytest.param(
+            [i % 3 != 0 for i in range(10)], (6, 4, 10, 0.6), id="accumulation"
+        ),
+    ],
+)
+def test_record_intervention_feedback(empty_memory, outcomes, expected):
+    """Test that recorded outcomes produce the expected counts and rate."""
+    for success in outcomes:
+        empty_memory.record_intervention_feedback("test_principle", success)
+
+    assert "test_principle" in empty_memory.intervention_feedback
+    feedback = empty_memory.intervention_feedback["test_principle"]
+    successes, failures, total, success_rate = expected
+    assert feedback.successes == successes
+    assert feedback.failures == failures
+    assert feedback.total == total
+    assert isclose(feedback.success_rate, success_rate, abs_tol=1e-9)
+
+
+def test_record_intervention_feedback_mixed_outcomes(empty_memory):
+    """Test that one more success updates a seeded 2/1 record to 3/1 (0.75)."""
+    empty_memory.intervention_feedback["friction_increase"] = InterventionFeedback(
+        successes=2, failures=1, total=3, success_rate=2 / 3
+    )
+
+    empty_memory.record_intervention_feedback("friction_increase", True)
+
+    feedback = empty_memory.intervention_feedback["friction_increase"]
+    assert (feedback.successes, feedback.failures, feedback.total) == (3, 1, 4)
+    assert isclose(feedback.success_rate, 0.75)
+
+
+def test_record_intervention_feedback_bulk_matches_single_calls(empty_memory):
+    """Test that bulk recording matches recording the outcomes one by one."""
+    outcomes = [i % 3 != 0 for i in range(10)]
+    for success in outcomes:
+        empty_memory.record_intervention_feedback("single", success)
+    _bulk(empty_memory, "bulk", outcomes)
+
+    assert (
+        empty_memory.intervention_feedback["bulk"]
+        == empty_memory.intervention_feedback["single"]
+    )
+
+
+def test_record_intervention_feedback_multiple_principles(empty_memory):
+    """Test tracking feedback for multiple principles independently."""
+    empty_memory.record_intervention_feedback("friction_increase", True)
+    empty_memory.record_intervention_feedback("loss_aversion", False)
+    empty_memory.record_intervention_feedback("friction_increase", True)
+
+    assert len(empty_memory.intervention_feedback) == 2
+    assert isclose(
+        empty_memory.intervention_feedback["friction_increase"].success_rate, 1.0
+    )
+    assert isclose(
+        empty_memory.intervention_feedback["loss_aversion"].success_rate,
+        0.0,
+        abs_tol=1e-9,
+    )
+
+
+# =============================================================================
+# UserMemory.get_most_effective_principles()
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    ("feedback_spec", "min_uses", "expected"),
+    [
+        pytest.param(
+            {"friction_increase": (2, 0)},
+            2,
+            [("friction_increase", 1.0)],
+            id="single_principle",
+        ),
+        pytest.param(
+            {"principle_a": (2, 0), "principle_b": (3, 1), "principle_c": (1, 1)},
+            2,
+            [("principle_a", 1.0), ("principle_b", 0.75), ("principle_c", 0.5)],
+            id="sorting",
+        ),
+        pytest.param(
+            {"principle_low": (1, 0), "principle_high": (2, 1)},
+            2,
+            [("principle_high", 2 / 3)],
+            id="min_uses_filter",
+        ),
+        pytest.param({"test_principle": (1, 0)}, 5, [], id="empty_list"),
+        pytest.param({}, 1, [], id="no_feedback"),
+        # min_uses=None calls the method without it (default of 2)
+        pytest.param(
+            {"principle_one": (1, 0), "principle_two": (2, 0)},
+            None,
+            [("principle_two", 1.0)],
+            id="default_min_uses",
+        ),
+    ],
+)
+def test_get_most_effective_principles(feedback_spec, min_uses, expected):
+    """Test filtering by min_uses and sorting by success rate (descending)."""
+    memory = _mem_with_feedback(feedback_spec)
+
+    if min_uses is None:
+        effective = memory.get_most_effective_principles()
+    else:
+        effective = memory.get_most_effective_principles(min_uses=min_uses)
+
+    assert [pid for pid, _ in effective] == [pid for pid, _ in expected]
+    for (_, rate), (_, expected_rate) in zip(effective, expected, strict=True):
+        assert isclose(rate, expected_rate)
+
+
+def test_get_most_effective_principles_correct_tuples(empty_memory):
+    """Test returns correct tuples of (principle_id, success_rate)."""
+    empty_memory.record_intervention_feedback("test_principle", True)
+    empty_memory.record_intervention_feedback("test_principle", False)
+
+    effective = empty_memory.get_most_effective_principles(min_uses=2)
+
+    assert len(effective) == 1
+    principle_id, success_rate = effective[0]
+    assert principle_id == "test_principle"
+    assert isclose(success_rate, 0.5)
+    assert isinstance(principle_id, str)
+    assert isinstance(success_rate, float)
+
+
+def test_get_most_effective_principles_with_existing_feedback(populated_memory):
+    """Test with pre-populated memory containing feedback."""
+    # populated_memory already has friction_increase (0.75) and loss_aversion (0.5)
+    effective = populated_memory.get_most_effective_principles(min_uses=2)
+
+    assert len(effective) == 2
+    assert effective[0][0] == "friction_increase"
+    assert isclose(effective[0][1], 0.75)
+    assert effective[1][0] == "loss_aversion"
+    assert isclose(effective[1][1], 0.5)
@@ -5,6 +5,14 @@ This module tests dataclass validation, serialization/deserialization,
 and type correctness of all domain models.
 """
 
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
 from src.memory import UserProfile
 from src.models import (
     AnalysisResult,
@@ -16,9 +24,44 @@ from src.models import (
     InterventionFeedback,
     StreakData,
     Struggle,
+    _now_iso,
 )
 
 
+def roundtrip(obj: Any, cls: type) -> Any:
+    """
+    Serialize obj through JSON text and rebuild it with cls.from_dict.
+
+    Going through json.dumps also fails the test if to_dict produces a
+    value that cannot be stored as JSON.
+    """
+    return cls.from_dict(json.loads(json.dumps(obj.to_dict())))
+
+
+class TestNowIso:
+    """Tests for the memoized default timestamp."""
+
+    def test_same_millisecond_reuses_timestamp(self):
+        """Test that calls within one millisecond return the same string."""
+        with patch("src.models.time.time", return_value=1_700_000_000.0004):
+            first = _now_iso()
+        with patch("src.models.time.time", return_value=1_700_000_000.0009):
+            second = _now_iso()
+
+        assert second is first
+        assert first == datetime.fromtimestamp(1_700_000_000.0004).isoformat()
+
+    def test_new_millisecond_refreshes_timestamp(self):
+        """Test that a later millisecond produces a new timestamp."""
+        with patch("src.models.time.time", return_value=1_700_000_000.0004):
+            first = _now_iso()
+        with patch("src.models.time.time", return_value=1_700_000_000.0024):
+            second = _now_iso()
+
+        assert second != first
+        assert second == datetime.fromtimestamp(1_700_000_000.0024).isoformat()
+
+
 class TestGoal:
     """Tests for Goal model."""
 
@@ -92,8 +135,7 @@ class TestStruggle:
     def test_struggle_serialization(self):
         """Test Struggle serialization round-trip."""
         struggle = Struggle(description="Impulse buying")
-        data = struggle.to_dict()
-        restored = Struggle.from_dict(data)
+        restored = roundtrip(struggle, Struggle)
         assert restored.description == struggle.description
         assert restored.count == struggle.count
 
@@ -131,10 +173,18 @@ class TestConversationTurn:
         assert data["role"] == "user"
         assert data["content"] == "Test message"
 
-        restored = ConversationTurn.from_dict(data)
+        restored = roundtrip(turn, ConversationTurn)
         assert restored.role == ConversationRole.USER
         assert restored.content == "Test message"
 
+    def test_conversation_turn_from_dict_role_lookup(self):
+        """Test that from_dict maps role strings and defaults unknown roles to USER."""
+        assistant = ConversationTurn.from_dict({"role": "assistant", "content": "Hi"})
+        unknown = ConversationTurn.from_dict({"role": "narrator", "content": "Hi"})
+
+        assert assistant.role is ConversationRole.ASSISTANT
+        assert unknown.role is ConversationRole.USER
+
 
 class TestInterventionFeedback:
     """Tests for InterventionFeedback model."""
@@ -157,11 +207,22 @@ class TestInterventionFeedback:
         feedback = InterventionFeedback(
             successes=2, failures=1, total=3, success_rate=0.67
         )
-        data = feedback.to_dict()
-        restored = InterventionFeedback.from_dict(data)
+        restored = roundtrip(feedback, InterventionFeedback)
         assert restored.successes == feedback.successes
         assert restored.total == feedback.total
 
+    def test_feedback_from_dict_missing_fields(self):
+        """Test that from_dict fills missing fields with defaults."""
+        feedback = InterventionFeedback.from_dict({"successes": 2})
+
+        assert feedback == InterventionFeedback(successes=2)
+
+    def test_feedback_from_dict_ignores_unknown_fields(self):
+        """Test that keys from other schema versions do not break loading."""
+        feedback = InterventionFeedback.from_dict({"successes": 1, "last_used": "2024"})
+
+        assert feedback == InterventionFeedback(successes=1)
+
 
 class TestBehaviouralPrinciple:
     """Tests for BehaviouralPrinciple model."""
@@ -189,11 +250,24 @@ class TestBehaviouralPrinciple:
             typical_triggers=["trigger1"],
             interventions=["intervention1"],
         )
-        data = principle.to_dict()
-        restored = BehaviouralPrinciple.from_dict(data)
+        restored = roundtrip(principle, BehaviouralPrinciple)
         assert restored.id == principle.id
         assert restored.name == principle.name
 
+    def test_principle_is_frozen_and_hashable(self):
+        """Test that principles are immutable and usable as dict keys."""
+        principle = BehaviouralPrinciple(
+            id="loss_aversion",
+            name="Loss Aversion",
+            description="People feel losses more strongly",
+            typical_triggers=["regret"],
+            interventions=["Track streaks"],
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            principle.name = "Changed"
+        assert {principle: 1}[BehaviouralPrinciple.from_dict(principle.to_dict())] == 1
+
 
 class TestBehaviourDatabase:
     """Tests for BehaviourDatabase model."""
@@ -217,10 +291,20 @@ class TestBehaviourDatabase:
     def test_database_serialization(self, sample_behaviour_database):
         """Test BehaviourDatabase serialization."""
         db = sample_behaviour_database
-        data = db.to_dict()
-        restored = BehaviourDatabase.from_dict(data)
+        restored = roundtrip(db, BehaviourDatabase)
         assert len(restored.principles) == len(db.principles)
         assert restored.version == db.version
+        assert restored == db
+
+    def test_get_principle_by_id_duplicate_returns_first(self):
+        """Test that the first principle wins when IDs are duplicated."""
+        first = BehaviouralPrinciple("dup", "First", "", [], [])
+        second = BehaviouralPrinciple("dup", "Second", "", [], [])
+        db = BehaviourDatabase(
+            version="1.0", description="", principles=[first, second]
+        )
+
+        assert db.get_principle_by_id("dup") is first
 
 
 class TestAnalysisResult:
@@ -250,8 +334,7 @@ class TestAnalysisResult:
             source="keyword",
             confidence=0.7,
         )
-        data = result.to_dict()
-        restored = AnalysisResult.from_dict(data)
+        restored = roundtrip(result, AnalysisResult)
         assert restored.detected_principle_id == result.detected_principle_id
         assert restored.confidence == result.confidence
 
@@ -331,6 +414,13 @@ class TestUserProfile:
         assert profile.preferred_tone == "supportive"  # Default
         assert profile.learning_speed == "moderate"  # Default
 
+    def test_from_dict_deserialization_ignores_unknown_fields(self):
+        """Test from_dict() skips keys that are not profile fields."""
+        profile = UserProfile.from_dict({"motivation_style": "social", "extra": 1})
+
+        assert profile.motivation_style == "social"
+        assert profile.risk_tolerance == "medium"  # Default
+
     def test_from_dict_deserialization_empty(self):
         """Test from_dict() deserialization with empty dictionary uses all defaults."""
         data = {}
@@ -418,11 +508,37 @@ class TestUserProfile:
             learning_speed="fast",
         )
 
-        data = original.to_dict()
-        restored = UserProfile.from_dict(data)
+        restored = roundtrip(original, UserProfile)
 
         assert restored.motivation_style == original.motivation_style
         assert restored.risk_tolerance == original.risk_tolerance
         assert restored.engagement_level == original.engagement_level
         assert restored.preferred_tone == original.preferred_tone
         assert restored.learning_speed == original.learning_speed
+
+    def test_update_from_interactions_advances_by_count(self):
+        """Test update_from_interactions() moves each level once per matching outcome."""
+        profile = UserProfile(engagement_level="low", learning_speed="slow")
+        outcomes = [
+            {"engaged": True},
+            {"engaged": True, "intervention_successful": True},
+            {"engaged": False},
+        ]
+
+        profile.update_from_interactions(outcomes)
+        assert profile.engagement_level == "high"
+        assert profile.learning_speed == "moderate"
+
+    def test_update_from_interactions_matches_single_updates(self):
+        """Test that a batch update equals applying each outcome in turn."""
+        outcomes = [{"engaged": True, "intervention_successful": True}] * 5
+        batched = UserProfile(engagement_level="low", learning_speed="slow")
+        sequential = UserProfile(engagement_level="low", learning_speed="slow")
+
+        batched.update_from_interactions(outcomes)
+        for outcome in outcomes:
+            sequential.update_from_interaction(outcome)
+
+        assert batched.to_dict() == sequential.to_dict()
+        assert batched.engagement_level == "high"
+        assert batched.learning_speed == "fast"
@@ -15,17 +15,27 @@ from google.adk.sessions import InMemorySessionService
 
 from src.habitledger_adk.runner import (
     create_runner,
+    create_runners_bulk,
     load_memory_from_session,
     save_memory_to_session,
 )
 from src.memory import UserMemory
 from src.models import Goal
+from src.session_db import get_session_service
 
 logger = logging.getLogger(__name__)
 
+pytestmark = [pytest.mark.asyncio, pytest.mark.integration]
+
+
+@pytest.fixture(autouse=True)
+def fresh_session_service():
+    """Give each test its own shared session service so sessions do not pile up."""
+    get_session_service.cache_clear()
+    yield
+    get_session_service.cache_clear()
+
 
-@pytest.mark.asyncio
-@pytest.mark.integration
 class TestAsyncRunner:
     """Test async runner functionality."""
 
@@ -73,13 +83,19 @@ class TestAsyncRunner:
         memory1.goals.append(Goal(description="Test goal", target="₹10000"))
         save_memory_to_session(session1, memory1)
 
-        # InMemorySessionService doesn't persist across different service instances
-        # So we just verify the session was created and memory can be saved/loaded
         reloaded_memory = load_memory_from_session(session1)
         assert reloaded_memory is not None
         assert len(reloaded_memory.goals) == 3  # 2 default + 1 custom
         assert any("Test goal" in g.description for g in reloaded_memory.goals)
 
+        # A second call reuses the service and finds the stored session
+        _, session_service2, session2, _ = await create_runner(user_id=user_id)
+        assert session_service2 is session_service1
+        assert session2.id == session1.id
+        stored_memory = load_memory_from_session(session2)
+        assert stored_memory is not None
+        assert stored_memory.user_id == user_id
+
     async def test_session_state_persistence_across_operations(self):
         """Test that session state persists within the same session object."""
         user_id = "test_persistence"
@@ -210,6 +226,29 @@ class TestAsyncRunner:
             memory = load_memory_from_session(session)
             assert memory.user_id == user_ids[i]
 
+    async def test_create_runners_bulk(self):
+        """Test that bulk creation returns one runner per user, in order."""
+        user_ids = [f"test_bulk_{i}" for i in range(5)]
+
+        results = await create_runners_bulk(user_ids, limit=2)
+
+        assert [session.user_id for _, _, session, _ in results] == user_ids
+        for user_id, (_, _, session, _) in zip(user_ids, results, strict=True):
+            memory = load_memory_from_session(session)
+            assert memory.user_id == user_id
+
+    async def test_create_runners_bulk_rejects_invalid_limit(self):
+        """Test that a non-positive limit is rejected."""
+        with pytest.raises(ValueError, match="limit"):
+            await create_runners_bulk(["test_bulk_invalid"], limit=0)
+
+    async def test_behaviour_db_shared_between_runners(self):
+        """Test that the behaviour database is loaded once and reused."""
+        *_, db1 = await create_runner(user_id="test_shared_db_1")
+        *_, db2 = await create_runner(user_id="test_shared_db_2")
+
+        assert db1 is db2
+
     async def test_error_handling_invalid_session(self):
         """Test that async session operations work without errors.
 
@@ -260,8 +299,6 @@ class TestAsyncRunner:
         assert len(session.events) >= 3
 
 
-@pytest.mark.asyncio
-@pytest.mark.integration
 class TestAsyncMemoryOperations:
     """Test memory operations in async context."""
 
@@ -347,6 +384,3 @@ class TestAsyncMemoryOperations:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])